@@ -17,6 +17,7 @@ from .plugins import create_default_manager, PluginManager, Plugin
 from .config import (
     register_config_extension,
     list_config_extensions,
+    config_extensions_view,
 )
 from .config import register_config_processor
 
@@ -60,6 +61,7 @@ __all__ = [
     "GLOBAL_EVENT_BUS",
     "register_config_extension",
     "list_config_extensions",
+    "config_extensions_view",
     "register_config_processor",
     "create_default_manager",
     "PluginManager",
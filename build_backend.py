@@ -350,10 +350,24 @@ def collect_dependency_selection(env_manager, dependency_names: List[str]) -> Di
     Only collects packages declared in [dependencies] to avoid copying entire site-packages.
     """
     code = r"""
-import sys, json, importlib.metadata as imd, sysconfig, os
+import sys, json, importlib.metadata as imd, sysconfig, os, re, mmap
 deps = sys.argv[1:]
 sp = sysconfig.get_paths().get("purelib") or sysconfig.get_paths().get("platlib")
 out = {}
+name_re = re.compile(rb'^Name:[ \t]*([^\r\n]*)', re.MULTILINE)
+dist_infos = None
+def meta_name(entry):
+    # Name: sits in the METADATA header; map the file and search only up
+    # to the first blank line instead of reading the long description
+    try:
+        with open(os.path.join(sp, entry, 'METADATA'), 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = mm.find(b"\n\n")
+                m = name_re.search(mm, 0, end if end != -1 else len(mm))
+                name = m.group(1).decode('utf-8', 'ignore').strip() if m else ''
+    except Exception:
+        name = entry.split('-')[0]
+    return name.lower().replace('_','-')
 for dep in deps:
     sel = {"modules": [], "dist_info": []}
     try:
@@ -371,22 +385,13 @@ for dep in deps:
         sel["modules"] = names
         # dist-info dir
         name_meta = (d.metadata.get("Name") or dep).lower().replace('_','-')
-        candidates = []
-        try:
-            for entry in os.listdir(sp):
-                if entry.endswith('.dist-info'):
-                    meta_name = None
-                    try:
-                        with open(os.path.join(sp, entry, 'METADATA'), 'r', encoding='utf-8', errors='ignore') as f:
-                            txt = f.read()
-                        line = next((l for l in txt.splitlines() if l.startswith('Name:')), '')
-                        meta_name = (line.split(':',1)[1].strip() if ':' in line else '').lower().replace('_','-')
-                    except Exception:
-                        meta_name = entry.split('-')[0].lower().replace('_','-')
-                    if meta_name == name_meta:
-                        candidates.append(entry)
-        except Exception:
-            pass
+        # dist-info names are read once and shared by all deps
+        if dist_infos is None:
+            try:
+                dist_infos = [(entry, meta_name(entry)) for entry in os.listdir(sp) if entry.endswith('.dist-info')]
+            except Exception:
+                dist_infos = []
+        candidates = [entry for entry, name in dist_infos if name == name_meta]
         if candidates:
             sel['dist_info'].append(candidates[0])
     except Exception:
@@ -28,6 +28,44 @@ from .event_bus import GLOBAL_EVENT_BUS as EVENTS
 from .plugins import create_default_manager
 
 
+# Build cache files only hold a hex digest; never read more than this
+_CACHE_READ_LIMIT = 256
+_CACHE_KEY_RE = re.compile(rb'"key"\s*:\s*"([0-9a-f]+)"')
+
+# Project type -> backend used to scaffold and build it
+_PROJECT_TYPE_TO_BACKEND = {
+    "python": "python",
+    "rust-python": "rust-python",
+}
+
+# Fallback templates used when a backend cannot set up the project itself
+_INIT_TEMPLATE = b'"""Package %s"""\n\n__version__ = "0.1.0"\n'
+_README_TEMPLATE = (
+    b"# %s\n\n%s\n\n```bash\npip install %s\n```\n\n```python\nimport %s\n```\n"
+)
+
+
+def _write_new_file(path: Path, payload: bytes) -> bool:
+    """Create `path` with `payload` unless it already exists.
+
+    Parameters:
+        path (Path): Target file path.
+        payload (bytes): Encoded file content.
+
+    Returns:
+        bool: True if the file was created; False if it already existed.
+    """
+    try:
+        fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return False
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+    return True
+
+
 class BuildManager:
     """Orchestrates project builds across backends.
 
@@ -780,7 +818,8 @@ class ProjectInitializer:
                 self.backend_manager.discover()
             except Exception:
                 pass
-            backend = self.backend_manager.get_backend("rust-python" if project_type == "rust-python" else "python")
+            backend_name = _PROJECT_TYPE_TO_BACKEND.get(project_type, "python")
+            backend = self.backend_manager.get_backend(backend_name)
             if not backend:
                 print(f"Backend not found for project type: {project_type}")
                 return False
@@ -788,7 +827,7 @@ class ProjectInitializer:
                 return False
                 
             # Create and save initial config with backend defaults
-            config = self._create_project_config(name, project_type, version)
+            config = self._create_project_config(name, project_type, version, backend_name)
             
             try:
                 config = config_manager.apply_extension_defaults(config)
@@ -829,24 +868,9 @@ class ProjectInitializer:
             if not ok:
                 package_dir = self.project_root / name
                 package_dir.mkdir(exist_ok=True)
-                init_file = package_dir / "__init__.py"
-                if not init_file.exists():
-                    init_file.write_text(f'"""Package {name}"""\n\n__version__ = "0.1.0"\n')
-                readme_file = self.project_root / "README.md"
-                if not readme_file.exists():
-                    readme_content = f"""# {name}
-
-{name}
-
-```bash
-pip install {name}
-```
-
-```python
-import {name}
-```
-"""
-                    readme_file.write_text(readme_content)
+                name_b = name.encode("utf-8")
+                _write_new_file(package_dir / "__init__.py", _INIT_TEMPLATE % name_b)
+                _write_new_file(self.project_root / "README.md", _README_TEMPLATE % (name_b, name_b, name_b, name_b))
 
             return True
             
@@ -856,19 +880,22 @@ import {name}
             
             
     def _create_project_config(self, name: str, project_type: str, 
-                             version: str) -> Dict[str, Any]:
+                             version: str, backend_name: Optional[str] = None) -> Dict[str, Any]:
         """Create the initial project configuration mapping.
 
         Parameters:
             name (str): Project name.
             project_type (str): Project type.
             version (str): Project version.
+            backend_name (Optional[str]): Backend already resolved for
+                `project_type`; resolved here when omitted.
 
         Returns:
             Dict[str, Any]: Initial configuration with backend defaults.
         """
         # Get backend name and instance
-        backend_name = "rust-python" if project_type == "rust-python" else "python"
+        if backend_name is None:
+            backend_name = _PROJECT_TYPE_TO_BACKEND.get(project_type, "python")
         backend = self.backend_manager.get_backend(backend_name)
         
         config = {
@@ -936,7 +963,7 @@ import {name}
         m.update(backend_name.encode("utf-8"))
         try:
             dump = json.dumps(config, sort_keys=True, ensure_ascii=False)
-        except Exception:
+        except (TypeError, ValueError):
             dump = str(config)
         m.update(dump.encode("utf-8"))
         return m.hexdigest()
@@ -955,11 +982,19 @@ import {name}
         if not cf.exists():
             return False
         try:
-            data = json.loads(cf.read_text(encoding="utf-8"))
-            prev_key = data.get("key")
-            return prev_key == self._cache_key(config, backend_name)
-        except Exception:
+            fd = os.open(str(cf), os.O_RDONLY)
+            try:
+                raw = os.read(fd, _CACHE_READ_LIMIT)
+            finally:
+                os.close(fd)
+        except OSError:
             return False
+        # The cache file is tiny and written by `_update_cache`; a regex over
+        # the raw bytes avoids a full decode + JSON parse on the hit path.
+        m = _CACHE_KEY_RE.search(raw)
+        if not m:
+            return False
+        return m.group(1).decode("ascii") == self._cache_key(config, backend_name)
 
     def _update_cache(self, backend_name: str, config: Dict[str, Any]) -> None:
         """Update the cache index with the current build key.
@@ -974,5 +1009,6 @@ import {name}
         }
         try:
             cf.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-        except Exception:
+        except OSError:
+            # Cache is best-effort; a failed write only costs a rebuild
             pass
\ No newline at end of file
@@ -182,8 +182,10 @@ class PackageBuilder:
                 config = self.config_manager.load()
                 info["dependencies"] = config.get("dependencies", {})
                 info["dev_dependencies"] = config.get("dev-dependencies", {})
-                info["run_commands"] = config.get("run", {}).get("commands", {})
-            except Exception:
+                run = config.get("run", {})
+                info["run_commands"] = run.get("commands", {}) if isinstance(run, dict) else {}
+            except (OSError, ValueError):
+                # Unreadable or invalid config: report runtime info only
                 pass
         
         return info
@@ -7,10 +7,21 @@ without `tomli_w`, an extensible processor chain, and a registry for
 configuration extensions.
 """
 
+import os
+import stat
 import sys
+import tempfile
+import copy
+import io
+import mmap
+import bisect
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Callable
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Callable, Tuple, Iterator, Iterable, Mapping, NamedTuple
 import json
+import re
 
 try:
     import tomllib
@@ -22,24 +33,269 @@ except ImportError:
         print("Please run: pip install tomli")
         sys.exit(1)
 
+try:
+    import tomli_w  # type: ignore
+except ImportError:
+    tomli_w = None
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+
+# Configuration keys used throughout the manager, interned once
+_K_PROJECT = sys.intern("project")
+_K_BUILD_SYSTEM = sys.intern("build-system")
+_K_BUILD = sys.intern("build")
+_K_BACKEND = sys.intern("backend")
+_K_TOOL = sys.intern("tool")
+_K_PLUGINS = sys.intern("plugins")
+_K_DEPS = sys.intern("dependencies")
+_K_DEV_DEPS = sys.intern("dev-dependencies")
+_K_PIP = sys.intern("pip")
+_K_INDEX_URL = sys.intern("index-url")
+_K_EXTRA_INDEX_URL = sys.intern("extra-index-url")
+_K_TRUSTED_HOST = sys.intern("trusted-host")
+_K_RUST_PYTHON = sys.intern("rust-python")
+
+# `[build.pip]` key -> (environment variable, accepts str-or-list)
+_PIP_ENV_MAP: Tuple[Tuple[str, str, bool], ...] = (
+    (_K_INDEX_URL, "PIP_INDEX_URL", False),
+    (_K_EXTRA_INDEX_URL, "PIP_EXTRA_INDEX_URL", True),
+    (_K_TRUSTED_HOST, "PIP_TRUSTED_HOST", True),
+)
+
+# Static part of the `[project]` table produced by `create_template`;
+# `name`, `version` and `authors` are filled per call
+_TEMPLATE_PROJECT: Dict[str, Any] = {
+    "name": "",
+    "version": "",
+    "description": "",
+    "authors": None,
+    "license": "",
+    "readme": "README.md",
+}
+
+# Parsed config files shared across ConfigManager instances:
+# resolved path -> (st_mtime_ns, st_size, parsed mapping before processors)
+_PARSED_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+# `X.Y` with integer major/minor, optionally followed by further `.` parts
+_VERSION_RE = re.compile(r"^\d+\.\d+(?:\.|$)")
+
+# Shared read-only default for absent sections during validation
+_EMPTY: Dict[str, Any] = {}
+
+# Escapes applied to basic TOML strings by the minimal serializer
+_TOML_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+# Files above this size are mapped instead of read into a heap buffer
+_MMAP_THRESHOLD = 64 * 1024
+
+# Line-delimited lock files start with a compact header naming the layout
+# version; legacy lock files are a single indented JSON document
+LOCK_NDJSON_VERSION = 2
+_LOCK_NDJSON_PREFIX = b'{"lock_version":'
+_LOCK_SECTIONS = (_K_DEPS, _K_DEV_DEPS)
+
+
+def _read_config_text(path: Path) -> str:
+    """Read a configuration file as UTF-8 text.
+
+    Small files are read in one call; larger files are decoded straight
+    from a read-only memory map so the raw bytes are never copied onto
+    the heap.
+
+    Parameters:
+        path (Path): File to read.
+
+    Returns:
+        str: Decoded file content.
+
+    Raises:
+        OSError: If the file cannot be opened or mapped.
+        UnicodeDecodeError: If the content is not valid UTF-8.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= _MMAP_THRESHOLD:
+            return f.read().decode("utf-8")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise"):
+                for advice in ("MADV_WILLNEED", "MADV_SEQUENTIAL"):
+                    flag = getattr(mmap, advice, None)
+                    if flag is not None:
+                        mm.madvise(flag)
+            return str(mm, "utf-8")
+
+
+def _atomic_write_bytes(path: Path, data: bytes, durable: bool = False) -> None:
+    """Replace `path` with `data` without exposing a partially written file.
+
+    The payload is written to a uniquely named sibling temporary file in
+    one call and renamed over the target, keeping the target's permission
+    bits (or the umask default for a new file).
+
+    Parameters:
+        path (Path): Destination file.
+        data (bytes): Complete file content.
+        durable (bool): Flush the temporary file to disk before the rename.
+
+    Returns:
+        None
+
+    Raises:
+        OSError: If writing or renaming fails; the temporary file is removed.
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _encode_lock_data(lock_data: Dict[str, Any]) -> bytes:
+    """Serialize lock data to indented JSON bytes.
+
+    Serialization happens in memory so the file is written in one call
+    instead of one write per encoder chunk.
+
+    Parameters:
+        lock_data (Dict[str, Any]): Lock information mapping.
+
+    Returns:
+        bytes: UTF-8 encoded JSON document.
+
+    Raises:
+        TypeError: If the mapping contains non-serializable values.
+    """
+    if orjson is not None:
+        return orjson.dumps(lock_data, option=orjson.OPT_INDENT_2)
+    return json.dumps(lock_data, indent=2).encode("utf-8")
+
+
+def _lock_entries_from_dict(lock_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Flatten legacy lock data into per-dependency entries.
+
+    Parameters:
+        lock_data (Dict[str, Any]): Lock data in the single-document layout.
+
+    Returns:
+        Iterator[Dict[str, Any]]: One entry per locked dependency.
+    """
+    for section in _LOCK_SECTIONS:
+        for name, info in (lock_data.get(section) or {}).items():
+            entry = {"section": section, "name": name}
+            if isinstance(info, dict):
+                entry.update(info)
+            yield entry
+
+
+def _lock_dict_from_ndjson(raw: bytes) -> Dict[str, Any]:
+    """Rebuild the single-document lock layout from line-delimited data.
+
+    Parameters:
+        raw (bytes): Full line-delimited lock file content.
+
+    Returns:
+        Dict[str, Any]: Lock data with `metadata` and per-section mappings.
+
+    Raises:
+        ValueError: If a line is not valid JSON.
+    """
+    lines = raw.splitlines()
+    header = json.loads(lines[0])
+    data: Dict[str, Any] = {"metadata": header.get("metadata", {})}
+    for section in _LOCK_SECTIONS:
+        data[section] = {}
+    for line in lines[1:]:
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        section = entry.pop("section", _K_DEPS)
+        name = entry.pop("name")
+        data.setdefault(section, {})[name] = entry
+    return data
+
+
+def _normalize_str_list(value: Any) -> List[str]:
+    """Normalize a string-or-list-of-strings setting into stripped strings.
+
+    Parameters:
+        value (Any): Raw value, typically `str` or `list[str]`.
+
+    Returns:
+        List[str]: Non-empty stripped strings; empty for other types.
+
+    Raises:
+        None
+    """
+    if isinstance(value, str):
+        value = value.strip()
+        return [value] if value else []
+    if isinstance(value, list):
+        out: List[str] = []
+        for item in value:
+            if isinstance(item, str):
+                item = item.strip()
+                if item:
+                    out.append(item)
+        return out
+    return []
+
 
 def _minimal_toml_dump(data: Dict[str, Any]) -> str:
     """Serialize a simple Python mapping into TOML text.
 
+    Text wrapper around `_minimal_toml_dumpb`.
+
+    Parameters:
+        data (Dict[str, Any]): Mapping to serialize.
+
+    Returns:
+        str: TOML representation of the input mapping.
+
+    Raises:
+        None
+    """
+    return _minimal_toml_dumpb(data).decode("utf-8")
+
+
+def _minimal_toml_dumpb(data: Dict[str, Any]) -> bytes:
+    """Serialize a simple Python mapping into UTF-8 encoded TOML.
+
     The serializer supports basic structures only: top-level keys,
     nested tables, arrays, and scalar values (string, number, boolean).
     Complex types (e.g., dates, custom objects) are not supported.
+    Output is accumulated in a single growing `bytearray`.
 
     Parameters:
         data (Dict[str, Any]): Mapping to serialize.
 
     Returns:
-        str: TOML representation of the input mapping.
+        bytes: TOML representation of the input mapping.
 
     Raises:
         None
     """
-    lines: List[str] = []
+    buf = bytearray()
+    write = buf.extend
 
     def write_table(prefix: List[str], obj: Dict[str, Any]) -> None:
         scalars: Dict[str, Any] = {}
@@ -55,34 +311,31 @@ def _minimal_toml_dump(data: Dict[str, Any]) -> str:
                 scalars[k] = v
 
         if prefix:
-            lines.append("[" + ".".join(prefix) + "]")
+            write(b"[" + ".".join(prefix).encode("utf-8") + b"]\n")
         for k, v in scalars.items():
-            lines.append(f"{k} = {serialize_value(v)}")
+            write((k + " = " + serialize_value(v) + "\n").encode("utf-8"))
 
         for k, arr in arrays.items():
-            lines.append(f"{k} = {serialize_array(arr)}")
+            write((k + " = " + serialize_array(arr) + "\n").encode("utf-8"))
 
         for k, sub in subtables.items():
-            lines.append("")
+            write(b"\n")
             write_table(prefix + [k], sub)
 
-    def serialize_value(v: Any) -> str:
-        if isinstance(v, bool):
+    def serialize_value(v: Any, _bool=bool, _num=(int, float), _str=str) -> str:
+        if isinstance(v, _bool):
             return "true" if v else "false"
-        if isinstance(v, (int, float)):
-            return str(v)
+        if isinstance(v, _num):
+            return _str(v)
         if v is None:
             return '""'
-            
-        s = str(v)
-        s = s.replace("\\", "\\\\").replace("\"", "\\\"")
-        return f'"{s}"'
+        return '"' + _str(v).translate(_TOML_ESCAPES) + '"'
 
     def serialize_array(arr: List[Any]) -> str:
         return "[" + ", ".join(serialize_value(x) for x in arr) + "]"
 
     write_table([], data)
-    return "\n".join(lines) + "\n"
+    return bytes(buf) if buf else b"\n"
 
 
 class ConfigManager:
@@ -93,12 +346,14 @@ class ConfigManager:
     variables from build settings.
     """
     
-    def __init__(self, project_root: Optional[str] = None):
+    def __init__(self, project_root: Optional[str] = None, cache: bool = True):
         """Initialize the configuration manager.
 
         Parameters:
             project_root (Optional[str]): Project root directory. Defaults to
                 the current working directory when omitted.
+            cache (bool): Share parsed configuration with other instances
+                while the file's mtime and size are unchanged.
 
         Raises:
             None
@@ -107,6 +362,12 @@ class ConfigManager:
         self.config_file = self.project_root / "pypackage.toml"
         self.lock_file = self.project_root / "pypackage.lock"
         self._config = None
+        # Bumped whenever `_config` is replaced or mutated through this manager
+        self._config_version = 0
+        self._pip_cache: Optional[Tuple[int, Dict[str, Any], Dict[str, str]]] = None
+        self._use_cache = cache
+        self._in_txn = False
+        self._dirty = False
         
     def exists(self) -> bool:
         """Return whether the configuration file exists in the project root.
@@ -140,15 +401,32 @@ class ConfigManager:
             raise FileNotFoundError(f"Configuration file not found: {self.config_file}")
             
         try:
-            raw = self.config_file.read_bytes()
-            stripped = raw.lstrip()
-            if stripped.startswith(b"{"):
-                cfg = json.loads(raw.decode("utf-8"))
-            else:
-                with open(self.config_file, "rb") as f:
-                    cfg = tomllib.load(f)
+            cache_key = None
+            cfg = None
+            if self._use_cache:
+                st = self.config_file.stat()
+                cache_key = str(self.config_file.resolve())
+                cached = _PARSED_CACHE.get(cache_key)
+                if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    # Callers mutate the returned mapping; never hand out the shared one
+                    cfg = copy.deepcopy(cached[2])
+            if cfg is None:
+                text = _read_config_text(self.config_file)
+                if self.config_file.suffix == ".json":
+                    cfg = json.loads(text)
+                else:
+                    try:
+                        cfg = tomllib.loads(text)
+                    except tomllib.TOMLDecodeError:
+                        # JSON content in a .toml file is still accepted
+                        if not text.lstrip().startswith("{"):
+                            raise
+                        cfg = json.loads(text)
+                if cache_key is not None:
+                    _PARSED_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(cfg))
             cfg = self._apply_processors(cfg, stage="load")
             self._config = cfg
+            self._config_version += 1
             return cfg
         except Exception as e:
             raise ValueError(f"Failed to parse configuration file: {e}")
@@ -178,17 +456,95 @@ class ConfigManager:
             
         try:
             to_save = self._apply_processors(config, stage="save")
+            payload = None
+            if tomli_w is not None:
+                try:
+                    payload = tomli_w.dumps(to_save).encode("utf-8")
+                except (TypeError, ValueError):
+                    # e.g. None values, which tomli_w rejects
+                    payload = None
+            if payload is None:
+                payload = _minimal_toml_dumpb(to_save)
             try:
-                import tomli_w  # type: ignore
-                with open(self.config_file, "wb") as f:
-                    tomli_w.dump(to_save, f)
-            except Exception:
-                toml_text = _minimal_toml_dump(to_save)
-                self.config_file.write_text(toml_text, encoding="utf-8")
+                unchanged = self.config_file.read_bytes() == payload
+            except OSError:
+                unchanged = False
+            if not unchanged:
+                _atomic_write_bytes(self.config_file, payload)
+                _PARSED_CACHE.pop(str(self.config_file.resolve()), None)
             self._config = to_save
+            self._config_version += 1
         except Exception as e:
             raise ValueError(f"Failed to save configuration: {e}")
 
+    @contextmanager
+    def transaction(self) -> Iterator["ConfigManager"]:
+        """Batch several mutations into a single `save()`.
+
+        Mutators called inside the block only update the in-memory
+        configuration; it is written once when the block exits cleanly.
+        If the block raises, pending changes are discarded and the next
+        `load()` re-reads the file.
+
+        Returns:
+            Iterator[ConfigManager]: This manager, for use in `with ... as`.
+
+        Raises:
+            ValueError: If persisting the batched changes fails.
+        """
+        if self._in_txn:
+            yield self
+            return
+        self._in_txn = True
+        self._dirty = False
+        try:
+            yield self
+        except BaseException:
+            self._config = None
+            self._config_version += 1
+            raise
+        finally:
+            self._in_txn = False
+        if self._dirty:
+            self._dirty = False
+            self.save(self._config)
+
+    def _commit(self, config: Dict[str, Any]) -> None:
+        """Persist a mutated configuration, deferring inside a transaction.
+
+        Parameters:
+            config (Dict[str, Any]): Updated configuration mapping.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If persistence fails.
+        """
+        self._config = config
+        self._config_version += 1
+        if self._in_txn:
+            self._dirty = True
+        else:
+            self.save(config)
+
+    def _mutate(self, fn: Callable[[Dict[str, Any]], Any]) -> None:
+        """Apply an in-place edit to the loaded configuration and persist it.
+
+        Parameters:
+            fn (Callable[[Dict[str, Any]], Any]): Function mutating the
+                configuration mapping in place; its return value is ignored.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If loading or persistence fails.
+        """
+        config = self._config if self._config is not None else self.load()
+        fn(config)
+        self._commit(config)
+
     def validate(self, config: Optional[Dict[str, Any]] = None) -> List[str]:
         """Validate configuration structure and required fields.
 
@@ -210,27 +566,7 @@ class ConfigManager:
             config = self._config or self.load()
         config = self._apply_processors(config, stage="pre_validate")
             
-        errors: List[str] = []
-
-        errors.extend(self._validate_build_system_section(config.get("build-system", {})))
-        errors.extend(self._validate_project_section(config.get("project", {})))
-        errors.extend(self._validate_dependencies_sections(config))
-
-        build_config = config.get("build", {})
-        if build_config:
-            errors.extend(self._validate_build_config(build_config))
-
-        errors.extend(self._validate_tool_section(config.get("tool", {})))
-
-        for name, ext in CONFIG_EXTENSIONS.items():
-            validator = ext.get("validator")
-            if callable(validator):
-                try:
-                    ext_errors = validator(config)
-                    if isinstance(ext_errors, list):
-                        errors.extend(ext_errors)
-                except Exception as e:
-                    errors.append(f"Configuration extension '{name}' validation failed: {e}")
+        errors = list(self._iter_errors(config))
         
         try:
             _ = self._apply_processors(config, stage="post_validate")
@@ -238,76 +574,122 @@ class ConfigManager:
             pass
         return errors
 
-    def _validate_build_system_section(self, build_system: Dict[str, Any]) -> List[str]:
+    def is_valid(self, config: Optional[Dict[str, Any]] = None) -> bool:
+        """Return whether the configuration passes validation.
+
+        Stops at the first error instead of collecting all of them; use
+        `validate()` when the messages are needed.
+
+        Parameters:
+            config (Optional[Dict[str, Any]]): Configuration to check. If
+                omitted, the currently loaded configuration is checked.
+
+        Returns:
+            bool: True if no validation error is found; otherwise False.
+
+        Raises:
+            None
+        """
+        if config is None:
+            config = self._config or self.load()
+        config = self._apply_processors(config, stage="pre_validate")
+        return next(self._iter_errors(config), None) is None
+
+    def _iter_errors(self, config: Dict[str, Any]) -> Iterator[str]:
+        """Yield validation errors section by section, lazily.
+
+        Parameters:
+            config (Dict[str, Any]): Configuration after `pre_validate`.
+
+        Returns:
+            Iterator[str]: Validation error messages.
+
+        Raises:
+            None
+        """
+        yield from self._validate_build_system_section(config.get(_K_BUILD_SYSTEM, _EMPTY))
+        yield from self._validate_project_section(config.get(_K_PROJECT, _EMPTY))
+        yield from self._validate_dependencies_sections(config)
+
+        build_config = config.get(_K_BUILD, _EMPTY)
+        if build_config:
+            yield from self._validate_build_config(build_config)
+
+        yield from self._validate_tool_section(config.get(_K_TOOL, _EMPTY))
+
+        for name, validator in _registered_hooks("validator"):
+            try:
+                ext_errors = validator(config)
+            except Exception as e:
+                yield f"Configuration extension '{name}' validation failed: {e}"
+                continue
+            if isinstance(ext_errors, list):
+                yield from ext_errors
+
+    def _validate_build_system_section(self, build_system: Dict[str, Any]) -> Iterator[str]:
         """Validate the `[build-system]` section.
 
         Parameters:
             build_system (Dict[str, Any]): The build-system mapping.
 
         Returns:
-            List[str]: Validation errors for the build-system section.
+            Iterator[str]: Validation errors for the build-system section.
 
         Raises:
             None
         """
-        errs: List[str] = []
         if not build_system:
-            return errs
+            return
         if "requires" in build_system and not isinstance(build_system.get("requires"), list):
-            errs.append("build-system.requires must be a list")
+            yield "build-system.requires must be a list"
         if "build-backend" in build_system and not isinstance(build_system.get("build-backend"), str):
-            errs.append("build-system.build-backend must be a string")
-        return errs
+            yield "build-system.build-backend must be a string"
 
-    def _validate_project_section(self, project: Dict[str, Any]) -> List[str]:
+    def _validate_project_section(self, project: Dict[str, Any]) -> Iterator[str]:
         """Validate the `[project]` section.
 
         Parameters:
             project (Dict[str, Any]): Project metadata mapping.
 
         Returns:
-            List[str]: Validation errors for the project section.
+            Iterator[str]: Validation errors for the project section.
 
         Raises:
             None
         """
-        errs: List[str] = []
         if not project:
-            errs.append("Missing [project] section")
-            return errs
+            yield "Missing [project] section"
+            return
         for field in ["name", "version"]:
             if field not in project:
-                errs.append(f"Missing required field: project.{field}")
+                yield f"Missing required field: project.{field}"
         version = project.get("version", "")
         if version and not self._is_valid_version(version):
-            errs.append(f"Invalid version format: {version}")
-        return errs
+            yield f"Invalid version format: {version}"
 
-    def _validate_dependencies_sections(self, config: Dict[str, Any]) -> List[str]:
+    def _validate_dependencies_sections(self, config: Dict[str, Any]) -> Iterator[str]:
         """Validate `dependencies` and `dev-dependencies` sections.
 
         Parameters:
             config (Dict[str, Any]): Entire configuration mapping.
 
         Returns:
-            List[str]: Validation errors for dependency sections.
+            Iterator[str]: Validation errors for dependency sections.
 
         Raises:
             None
         """
-        errs: List[str] = []
-        for dep_type in ["dependencies", "dev-dependencies"]:
+        for dep_type in [_K_DEPS, _K_DEV_DEPS]:
             deps = config.get(dep_type, {})
             if not isinstance(deps, dict):
-                errs.append(f"{dep_type} must be a mapping")
+                yield f"{dep_type} must be a mapping"
                 continue
             for name, version_spec in deps.items():
                 if not isinstance(name, str) or not name.strip():
-                    errs.append(f"{dep_type} contains invalid package name: {name}")
+                    yield f"{dep_type} contains invalid package name: {name}"
                     continue
                 if not isinstance(version_spec, str) or not version_spec.strip():
-                    errs.append(f"{dep_type} entry {name} has invalid version spec")
-        return errs
+                    yield f"{dep_type} entry {name} has invalid version spec"
     
     def _is_valid_version(self, version: str) -> bool:
         """Check whether a version string is valid (simplified).
@@ -316,94 +698,79 @@ class ConfigManager:
             version (str): Version string to check.
 
         Returns:
-            bool: True if major and minor parts are integers; otherwise False.
+            bool: True if the version starts with integer major and minor
+                parts; otherwise False.
 
         Raises:
             None
         """
-        parts = version.split(".")
-        if len(parts) < 2:
-            return False
-            
-        try:
-            # Check if major and minor parts are integers
-            int(parts[0])
-            int(parts[1])
-            return True
-        except ValueError:
-            return False
+        return _VERSION_RE.match(version) is not None
     
-    def _validate_build_config(self, build_config: Dict[str, Any]) -> List[str]:
+    def _validate_build_config(self, build_config: Dict[str, Any]) -> Iterator[str]:
         """Validate the `[build]` configuration section.
 
         Parameters:
             build_config (Dict[str, Any]): Build configuration mapping.
 
         Returns:
-            List[str]: Validation errors for the build section.
+            Iterator[str]: Validation errors for the build section.
 
         Raises:
             None
         """
-        errors = []
-        
         # Validate build backend (supports single string or parallel list)
-        backend = build_config.get("backend", "python")
+        backend = build_config.get(_K_BACKEND, "python")
         if not isinstance(backend, str):
-            errors.append("build.backend must be a string")
+            yield "build.backend must be a string"
         
 
-        if "pip" in build_config:
-            pip_cfg = build_config["pip"]
+        if _K_PIP in build_config:
+            pip_cfg = build_config[_K_PIP]
             if not isinstance(pip_cfg, dict):
-                errors.append("build.pip must be a mapping")
+                yield "build.pip must be a mapping"
             else:
                 # Only validate common keys, let backend handle unknown keys
-                if "index-url" in pip_cfg and not isinstance(pip_cfg.get("index-url"), str):
-                    errors.append("build.pip.index-url must be a string")
-                if "extra-index-url" in pip_cfg:
-                    extra = pip_cfg.get("extra-index-url")
+                if _K_INDEX_URL in pip_cfg and not isinstance(pip_cfg.get(_K_INDEX_URL), str):
+                    yield "build.pip.index-url must be a string"
+                if _K_EXTRA_INDEX_URL in pip_cfg:
+                    extra = pip_cfg.get(_K_EXTRA_INDEX_URL)
                     if isinstance(extra, list):
                         for x in extra:
                             if not isinstance(x, str):
-                                errors.append("build.pip.extra-index-url entries must be strings")
+                                yield "build.pip.extra-index-url entries must be strings"
                     elif not isinstance(extra, str):
-                        errors.append("build.pip.extra-index-url must be string or list of strings")
-                if "trusted-host" in pip_cfg:
-                    th = pip_cfg.get("trusted-host")
+                        yield "build.pip.extra-index-url must be string or list of strings"
+                if _K_TRUSTED_HOST in pip_cfg:
+                    th = pip_cfg.get(_K_TRUSTED_HOST)
                     if isinstance(th, list):
                         for h in th:
                             if not isinstance(h, str):
-                                errors.append("build.pip.trusted-host entries must be strings")
+                                yield "build.pip.trusted-host entries must be strings"
                     elif not isinstance(th, str):
-                        errors.append("build.pip.trusted-host must be string or list of strings")
-        
-        return errors
+                        yield "build.pip.trusted-host must be string or list of strings"
 
-    def _validate_tool_section(self, tool_cfg: Dict[str, Any]) -> List[str]:
+    def _validate_tool_section(self, tool_cfg: Dict[str, Any]) -> Iterator[str]:
         """Validate the `[tool]` section and its `plugins` list.
 
         Parameters:
             tool_cfg (Dict[str, Any]): Top-level tool configuration mapping.
 
         Returns:
-            List[str]: Validation errors for the tool section.
+            Iterator[str]: Validation errors for the tool section.
 
         Raises:
             None
         """
-        errs: List[str] = []
         if not isinstance(tool_cfg, dict):
-            errs.append("[tool] must be a mapping")
-            return errs
-        plugins = tool_cfg.get("plugins")
+            yield "[tool] must be a mapping"
+            return
+        plugins = tool_cfg.get(_K_PLUGINS)
         if plugins is not None and not isinstance(plugins, list):
-            errs.append("[tool]plugins must be a list")
+            yield "[tool]plugins must be a list"
         elif isinstance(plugins, list):
             for p in plugins:
                 if not isinstance(p, str) or not p.strip():
-                    errs.append("[tool]plugins entries must be non-empty strings")
-        return errs
+                    yield "[tool]plugins entries must be non-empty strings"
     
     
     def create_template(self, name: str, version: str = "0.1.0", backend: str = "python") -> Dict[str, Any]:
@@ -420,28 +787,23 @@ class ConfigManager:
         Raises:
             None
         """
-        template = {
-            "project": {
-                "name": name,
-                "version": version,
-                "description": "",
-                "authors": [],
-                "license": "",
-                "readme": "README.md"
+        # Only the mutable leaves need fresh objects; the scalar defaults
+        # are shared through a shallow copy of the prototype
+        project = _TEMPLATE_PROJECT.copy()
+        project["name"] = name
+        project["version"] = version
+        project["authors"] = []
+        return {
+            _K_PROJECT: project,
+            _K_BUILD: {
+                _K_BACKEND: backend
             },
-            "build": {
-                "backend": backend
+            _K_TOOL: {
+                _K_PLUGINS: []
             },
-            "tool": {
-                "plugins": []
-            },
-            "dependencies": {},
-            "dev-dependencies": {}
+            _K_DEPS: {},
+            _K_DEV_DEPS: {}
         }
-        
-        
-        
-        return template
     
     def get_build_system(self) -> Dict[str, Any]:
         """Return the `[build-system]` configuration table.
@@ -453,7 +815,7 @@ class ConfigManager:
             None
         """
         config = self.load()
-        return config.get("build-system", {})
+        return config.get(_K_BUILD_SYSTEM, {})
     
     def get_project_info(self) -> Dict[str, Any]:
         """Return the `[project]` section with basic metadata.
@@ -465,7 +827,7 @@ class ConfigManager:
             None
         """
         config = self.load()
-        return config.get("project", {})
+        return config.get(_K_PROJECT, {})
     
     def get_dependencies(self, dev: bool = False) -> Dict[str, str]:
         """Return declared dependencies.
@@ -481,7 +843,7 @@ class ConfigManager:
             None
         """
         config = self.load()
-        dep_key = "dev-dependencies" if dev else "dependencies"
+        dep_key = _K_DEV_DEPS if dev else _K_DEPS
         return config.get(dep_key, {})
     
     def add_dependency(self, name: str, version: str, dev: bool = False) -> None:
@@ -499,13 +861,15 @@ class ConfigManager:
             None
         """
         config = self.load()
-        dep_key = "dev-dependencies" if dev else "dependencies"
+        dep_key = _K_DEV_DEPS if dev else _K_DEPS
         
         if dep_key not in config:
             config[dep_key] = {}
+        elif config[dep_key].get(name) == version:
+            return
             
         config[dep_key][name] = version
-        self.save(config)
+        self._commit(config)
     
     def remove_dependency(self, name: str, dev: bool = False) -> bool:
         """Remove a dependency entry if present.
@@ -521,11 +885,11 @@ class ConfigManager:
             None
         """
         config = self.load()
-        dep_key = "dev-dependencies" if dev else "dependencies"
+        dep_key = _K_DEV_DEPS if dev else _K_DEPS
         
         if dep_key in config and name in config[dep_key]:
             del config[dep_key][name]
-            self.save(config)
+            self._commit(config)
             return True
             
         return False
@@ -540,7 +904,7 @@ class ConfigManager:
             None
         """
         config = self.load()
-        return config.get("build", {})
+        return config.get(_K_BUILD, {})
     
     def set_build_config(self, build_config: Dict[str, Any]) -> None:
         """Overwrite the `[build]` configuration section.
@@ -554,9 +918,9 @@ class ConfigManager:
         Raises:
             None
         """
-        config = self.load()
-        config["build"] = build_config
-        self.save(config)
+        def apply(config: Dict[str, Any]) -> None:
+            config[_K_BUILD] = build_config
+        self._mutate(apply)
     
     def update_build_config(self, updates: Dict[str, Any]) -> None:
         """Merge updates into the `[build]` configuration section.
@@ -570,12 +934,7 @@ class ConfigManager:
         Raises:
             None
         """
-        config = self.load()
-        if "build" not in config:
-            config["build"] = {}
-        
-        config["build"].update(updates)
-        self.save(config)
+        self._mutate(lambda config: config.setdefault(_K_BUILD, {}).update(updates))
 
     def get_tool_config(self) -> Dict[str, Any]:
         """Return the top-level `[tool]` configuration table.
@@ -587,7 +946,7 @@ class ConfigManager:
             None
         """
         cfg = self.load()
-        tool = cfg.get("tool", {})
+        tool = cfg.get(_K_TOOL, {})
         return tool if isinstance(tool, dict) else {}
 
     def set_tool_config(self, tool_cfg: Dict[str, Any]) -> None:
@@ -602,9 +961,9 @@ class ConfigManager:
         Raises:
             None
         """
-        cfg = self.load()
-        cfg["tool"] = tool_cfg if isinstance(tool_cfg, dict) else {}
-        self.save(cfg)
+        def apply(cfg: Dict[str, Any]) -> None:
+            cfg[_K_TOOL] = tool_cfg if isinstance(tool_cfg, dict) else {}
+        self._mutate(apply)
 
     def get_tool_plugins(self) -> List[str]:
         """Return the list of plugin names under `[tool]plugins`.
@@ -616,7 +975,7 @@ class ConfigManager:
             None
         """
         tool = self.get_tool_config()
-        plugins = tool.get("plugins", [])
+        plugins = tool.get(_K_PLUGINS, [])
         if isinstance(plugins, list):
             return [str(p) for p in plugins if isinstance(p, str) and p.strip()]
         return []
@@ -636,21 +995,20 @@ class ConfigManager:
             None
         """
         cfg = self.load()
-        tool = cfg.get("tool", {}) if isinstance(cfg, dict) else {}
-        plugins = tool.get("plugins", [])
+        tool = cfg.setdefault(_K_TOOL, {})
+        plugins = tool.get(_K_PLUGINS)
         if not isinstance(plugins, list):
-            plugins = []
+            plugins = tool[_K_PLUGINS] = []
         if name not in plugins:
             plugins.append(name)
-        sect = tool.get(name, {}) if isinstance(tool, dict) else {}
+        sect = tool.get(name)
         if not isinstance(sect, dict):
-            sect = {}
+            sect = tool[name] = {}
         if isinstance(defaults, dict):
-            sect = {**defaults, **sect}
-        tool[name] = sect
-        tool["plugins"] = plugins
-        cfg["tool"] = tool
-        self.save(cfg)
+            # Existing values win over defaults
+            for k, v in defaults.items():
+                sect.setdefault(k, v)
+        self._commit(cfg)
 
     def remove_tool_plugin(self, name: str) -> None:
         """Remove a plugin name from `[tool]plugins` without deleting its section.
@@ -665,15 +1023,17 @@ class ConfigManager:
             None
         """
         cfg = self.load()
-        tool = cfg.get("tool", {}) if isinstance(cfg, dict) else {}
-        plugins = tool.get("plugins", [])
+        tool = cfg.get(_K_TOOL)
+        if not isinstance(tool, dict):
+            return
+        plugins = tool.get(_K_PLUGINS, [])
         if isinstance(plugins, list):
-            plugins = [p for p in plugins if p != name]
+            if name not in plugins:
+                return
+            plugins[:] = [p for p in plugins if p != name]
         else:
-            plugins = []
-        tool["plugins"] = plugins
-        cfg["tool"] = tool
-        self.save(cfg)
+            tool[_K_PLUGINS] = []
+        self._commit(cfg)
 
     def get_tool_section(self, name: str) -> Dict[str, Any]:
         """Return the `[tool.<name>]` configuration section.
@@ -704,11 +1064,9 @@ class ConfigManager:
         Raises:
             None
         """
-        cfg = self.load()
-        tool = cfg.get("tool", {}) if isinstance(cfg, dict) else {}
-        tool[name] = section if isinstance(section, dict) else {}
-        cfg["tool"] = tool
-        self.save(cfg)
+        def apply(cfg: Dict[str, Any]) -> None:
+            cfg.setdefault(_K_TOOL, {})[name] = section if isinstance(section, dict) else {}
+        self._mutate(apply)
 
     def update_tool_section(self, name: str, updates: Dict[str, Any]) -> None:
         """Merge updates into the `[tool.<name>]` configuration section.
@@ -724,14 +1082,13 @@ class ConfigManager:
             None
         """
         cfg = self.load()
-        tool = cfg.get("tool", {}) if isinstance(cfg, dict) else {}
-        sect = tool.get(name, {}) if isinstance(tool, dict) else {}
+        tool = cfg.setdefault(_K_TOOL, {})
+        sect = tool.get(name)
         if not isinstance(sect, dict):
-            sect = {}
-        sect.update(updates or {})
-        tool[name] = sect
-        cfg["tool"] = tool
-        self.save(cfg)
+            sect = tool[name] = {}
+        if updates:
+            sect.update(updates)
+        self._commit(cfg)
 
     def apply_extension_defaults(self, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Apply registered extension defaults to the build configuration.
@@ -747,21 +1104,15 @@ class ConfigManager:
             None
         """
         cfg = (config or self.load())
-        try:
-            build_cfg = cfg.get("build", {})
-            for name, ext in CONFIG_EXTENSIONS.items():
-                defaults_provider = ext.get("defaults_provider")
-                if callable(defaults_provider):
-                    try:
-                        defaults = defaults_provider() or {}
-                        if isinstance(defaults, dict):
-                            build_cfg.update(defaults)
-                    except Exception:
-                        pass
-            cfg["build"] = build_cfg
-            return cfg
-        except Exception:
-            return cfg
+        build_cfg = cfg.setdefault(_K_BUILD, {})
+        for _name, defaults_provider in _registered_hooks("defaults_provider"):
+            try:
+                defaults = defaults_provider()
+            except Exception:
+                continue
+            if defaults and isinstance(defaults, dict):
+                build_cfg.update(defaults)
+        return cfg
 
     def _apply_processors(self, cfg: Dict[str, Any], stage: str) -> Dict[str, Any]:
         """Apply registered processors for a given stage to a configuration.
@@ -779,7 +1130,11 @@ class ConfigManager:
         Raises:
             None
         """
-        processors = CONFIG_PROCESSORS.get(stage, [])
+        # The registry lists are read directly, so processors appended to
+        # them outside `register_config_processor` are still applied
+        processors = CONFIG_PROCESSORS.get(stage)
+        if not processors:
+            return cfg
         new_cfg = cfg
         for proc in processors:
             try:
@@ -800,7 +1155,7 @@ class ConfigManager:
             None
         """
         build_config = self.get_build_config()
-        return build_config.get("backend", "python")
+        return build_config.get(_K_BACKEND, "python")
     
     def set_build_backend(self, backend: str) -> None:
         """Set the build backend name in the configuration.
@@ -814,7 +1169,10 @@ class ConfigManager:
         Raises:
             None
         """
-        self.update_build_config({"backend": backend})
+        # Edit in place rather than going through update_build_config
+        def apply(config: Dict[str, Any]) -> None:
+            config.setdefault(_K_BUILD, {})[_K_BACKEND] = backend
+        self._mutate(apply)
 
     def get_backends(self) -> List[str]:
         """Return the list of parallel backends if configured.
@@ -858,11 +1216,9 @@ class ConfigManager:
         Raises:
             None
         """
-        config = self.load()
-        build_cfg = config.get("build", {})
-        build_cfg[backend] = cfg
-        config["build"] = build_cfg
-        self.save(config)
+        def apply(config: Dict[str, Any]) -> None:
+            config.setdefault(_K_BUILD, {})[backend] = cfg
+        self._mutate(apply)
 
     def get_rust_config(self) -> Dict[str, Any]:
         """Return the `rust-python` backend configuration table.
@@ -873,7 +1229,7 @@ class ConfigManager:
         Raises:
             None
         """
-        return self.get_backend_config("rust-python")
+        return self.get_backend_config(_K_RUST_PYTHON)
     
     def set_rust_config(self, rust_config: Dict[str, Any]) -> None:
         """Set the `rust-python` backend configuration.
@@ -887,7 +1243,7 @@ class ConfigManager:
         Raises:
             None
         """
-        self.set_backend_config("rust-python", rust_config)
+        self.set_backend_config(_K_RUST_PYTHON, rust_config)
 
     def get_pip_config(self) -> Dict[str, Any]:
         """Return the normalized pip mirror configuration.
@@ -898,54 +1254,69 @@ class ConfigManager:
             - `trusted-host` (str or list[str])
 
         Returns:
-            Dict[str, Any]: Normalized pip configuration.
+            Dict[str, Any]: Normalized pip configuration; a copy the caller
+                may modify without affecting the cached settings.
 
         Raises:
             None
         """
-        build_cfg = self.get_build_config()
-        pip_cfg = build_cfg.get("pip", {}) if isinstance(build_cfg, dict) else {}
+        return {k: list(v) if isinstance(v, list) else v for k, v in self._pip_settings()[0].items()}
 
-        result: Dict[str, Any] = {}
+    def get_pip_env(self) -> Dict[str, str]:
+        """Generate environment variables mapping from pip configuration.
 
-        idx = pip_cfg.get("index-url")
-        if isinstance(idx, str) and idx.strip():
-            result["index-url"] = idx.strip()
+        The values are cached until the configuration is reloaded or changed
+        through this manager; in-place edits to the mapping returned by
+        `get_build_config` take effect after `set_build_config` or `save`.
 
-        extra = pip_cfg.get("extra-index-url")
-        if isinstance(extra, str) and extra.strip():
-            result["extra-index-url"] = [extra.strip()]
-        elif isinstance(extra, list):
-            result["extra-index-url"] = [s for s in extra if isinstance(s, str) and s.strip()]
+        Returns:
+            Dict[str, str]: Mapping containing `PIP_*` environment variables.
 
-        th = pip_cfg.get("trusted-host")
-        if isinstance(th, str) and th.strip():
-            result["trusted-host"] = [th.strip()]
-        elif isinstance(th, list):
-            result["trusted-host"] = [s for s in th if isinstance(s, str) and s.strip()]
+        Raises:
+            None
+        """
+        return dict(self._pip_settings()[1])
 
-        return result
+    def _pip_settings(self) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Normalize `[build.pip]` and pre-join its `PIP_*` environment values.
 
-    def get_pip_env(self) -> Dict[str, str]:
-        """Generate environment variables mapping from pip configuration.
+        Both results are computed in one pass and cached against the
+        configuration version, so the list joins run once per configuration
+        change rather than once per subprocess launch. They are kept on the
+        manager and never stored in the configuration mapping itself, which
+        would leak them into `pypackage.toml` on the next save.
 
         Returns:
-            Dict[str, str]: Mapping containing `PIP_*` environment variables.
+            Tuple[Dict[str, Any], Dict[str, str]]: Normalized pip settings
+                and the derived environment variables.
 
         Raises:
             None
         """
-        cfg = self.get_pip_config()
+        build_cfg = self.get_build_config()
+        pip_cfg = build_cfg.get(_K_PIP) if isinstance(build_cfg, dict) else None
+        cached = self._pip_cache
+        if cached is not None and cached[0] == self._config_version:
+            return cached[1], cached[2]
+        result: Dict[str, Any] = {}
         env: Dict[str, str] = {}
-        if cfg.get("index-url"):
-            env["PIP_INDEX_URL"] = cfg["index-url"]
-        extra = cfg.get("extra-index-url", [])
-        if isinstance(extra, list) and extra:
-            env["PIP_EXTRA_INDEX_URL"] = " ".join(extra)
-        th = cfg.get("trusted-host", [])
-        if isinstance(th, list) and th:
-            env["PIP_TRUSTED_HOST"] = " ".join(th)
-        return env
+
+        if pip_cfg and isinstance(pip_cfg, dict):
+            for key, env_key, is_list in _PIP_ENV_MAP:
+                raw = pip_cfg.get(key)
+                if is_list:
+                    values = _normalize_str_list(raw)
+                    if values:
+                        result[key] = values
+                        env[env_key] = " ".join(values)
+                elif isinstance(raw, str):
+                    value = raw.strip()
+                    if value:
+                        result[key] = value
+                        env[env_key] = value
+
+        self._pip_cache = (self._config_version, result, env)
+        return result, env
 
     
     def save_lock_file(self, lock_data: Dict[str, Any]) -> None:
@@ -961,32 +1332,227 @@ class ConfigManager:
             ValueError: If writing the lock file fails.
         """
         try:
-            with open(self.lock_file, "w", encoding="utf-8") as f:
-                json.dump(lock_data, f, indent=2)
+            self._save_lock_file_raw(lock_data)
         except Exception as e:
             raise ValueError(f"Failed to save lock file: {e}")
+
+    def _save_lock_file_raw(self, lock_data: Dict[str, Any]) -> None:
+        """Write lock data, letting encoder and OS errors propagate.
+
+        Internal callers that handle failures themselves use this instead of
+        `save_lock_file`.
+
+        Parameters:
+            lock_data (Dict[str, Any]): Lock information mapping.
+
+        Returns:
+            None
+
+        Raises:
+            OSError: If writing fails.
+            TypeError: If the mapping contains non-serializable values.
+        """
+        self._write_lock_bytes(_encode_lock_data(lock_data))
+
+    def _write_lock_bytes(self, data: bytes) -> None:
+        """Atomically replace the lock file with pre-encoded lock data.
+
+        Parameters:
+            data (bytes): Encoded lock file content.
+
+        Returns:
+            None
+
+        Raises:
+            OSError: If writing fails.
+        """
+        _atomic_write_bytes(self.lock_file, data, durable=True)
     
+    def save_lock_file_ndjson(self, entries: Iterable[Dict[str, Any]],
+                              metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Save dependency lock data as line-delimited JSON.
+
+        The first line is a header carrying `lock_version` and the lock
+        metadata; every following line holds one dependency entry, e.g.
+        `{"section": "dependencies", "name": "requests", "version": "2.31.0"}`.
+        Lines are buffered and written in one call.
+
+        Parameters:
+            entries (Iterable[Dict[str, Any]]): Dependency entries, one per line.
+            metadata (Optional[Dict[str, Any]]): Lock metadata for the header.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If serialization or writing fails.
+        """
+        try:
+            buf = io.BytesIO()
+            header = {"lock_version": LOCK_NDJSON_VERSION, "metadata": metadata or {}}
+            buf.write(json.dumps(header, separators=(",", ":")).encode("utf-8"))
+            buf.write(b"\n")
+            for entry in entries:
+                buf.write(json.dumps(entry, separators=(",", ":")).encode("utf-8"))
+                buf.write(b"\n")
+            self._write_lock_bytes(buf.getvalue())
+        except Exception as e:
+            raise ValueError(f"Failed to save lock file: {e}")
+
+    def iter_lock_entries(self) -> Iterator[Dict[str, Any]]:
+        """Yield dependency entries from the lock file one at a time.
+
+        Line-delimited lock files are parsed one line at a time, so memory
+        stays bounded by the longest line. Legacy single-document lock files
+        are loaded whole and flattened into the same entry shape.
+
+        Returns:
+            Iterator[Dict[str, Any]]: Entries with `section` and `name` keys
+                plus the recorded package fields.
+
+        Raises:
+            ValueError: If reading or parsing the lock file fails.
+        """
+        try:
+            f = open(self.lock_file, "rb")
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            raise ValueError(f"Failed to load lock file: {e}")
+        with f:
+            first = f.readline()
+            if not first.startswith(_LOCK_NDJSON_PREFIX):
+                f.close()
+                data = self.load_lock_file()
+                if data:
+                    yield from _lock_entries_from_dict(data)
+                return
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"Failed to load lock file: {e}")
+                yield entry
+
     def load_lock_file(self) -> Optional[Dict[str, Any]]:
         """Load dependency lock data if present.
 
         Returns:
-            Optional[Dict[str, Any]]: Lock data mapping, or None if absent.
+            Optional[Dict[str, Any]]: Lock data mapping, or None if absent
+                or empty.
 
         Raises:
             ValueError: If reading or parsing the lock file fails.
         """
-        if not self.lock_file.exists():
-            return None
-            
         try:
-            with open(self.lock_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return self._load_lock_file_raw()
+        except FileNotFoundError:
+            return None
         except Exception as e:
             raise ValueError(f"Failed to load lock file: {e}")
 
+    def _load_lock_file_raw(self) -> Optional[Dict[str, Any]]:
+        """Load lock data, letting OS and parser errors propagate.
+
+        Internal callers that handle failures themselves use this instead of
+        `load_lock_file`.
+
+        Returns:
+            Optional[Dict[str, Any]]: Lock data mapping, or None if empty.
+
+        Raises:
+            FileNotFoundError: If the lock file does not exist.
+            OSError: If reading fails.
+            ValueError: If parsing fails.
+        """
+        st = self.lock_file.stat()
+        if st.st_size == 0:
+            return None
+
+        with open(self.lock_file, "rb") as f:
+            raw = f.read()
+        if raw.startswith(_LOCK_NDJSON_PREFIX):
+            data = _lock_dict_from_ndjson(raw)
+        elif orjson is not None:
+            data = orjson.loads(raw)
+        else:
+            data = json.loads(raw.decode("utf-8"))
+        return data
+
+
+
+class _ExtEntry(NamedTuple):
+    """Registered configuration extension hooks.
+
+    Also answers `entry["validator"]` and `entry.get("validator")` so code
+    written against the former dict entries keeps working.
+    """
+
+    validator: Callable[[Dict[str, Any]], List[str]]
+    defaults_provider: Callable[[], Dict[str, Any]]
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default) if key in self._fields else default
+
+
+CONFIG_EXTENSIONS: Dict[str, _ExtEntry] = {}
+_CONFIG_EXTENSIONS_VIEW = MappingProxyType(CONFIG_EXTENSIONS)
+
+# Registered extension names kept sorted on registration
+_EXTENSION_NAMES_SORTED: Tuple[str, ...] = ()
+
+# Shared results of the default extension hooks; never mutate these
+_NO_ERRORS: List[str] = []
+_NO_DEFAULTS: Dict[str, Any] = {}
+
+
+def _noop_validator(_cfg: Dict[str, Any]) -> List[str]:
+    """Default extension validator: reports no errors."""
+    return _NO_ERRORS
+
+
+def _noop_defaults() -> Dict[str, Any]:
+    """Default extension defaults provider: contributes nothing."""
+    return _NO_DEFAULTS
+
 
+# Per-hook (name, callable) snapshots of CONFIG_EXTENSIONS, rebuilt after registration
+_EXT_CACHE: Dict[str, Tuple[Tuple[str, Callable], ...]] = {}
 
-CONFIG_EXTENSIONS: Dict[str, Dict[str, Callable]] = {}
+
+def _registered_hooks(kind: str) -> Tuple[Tuple[str, Callable], ...]:
+    """Return registered extensions providing a callable `kind` hook.
+
+    Parameters:
+        kind (str): Hook key, `validator` or `defaults_provider`.
+
+    Returns:
+        Tuple[Tuple[str, Callable], ...]: `(extension name, hook)` pairs in
+            registration order.
+
+    Raises:
+        None
+    """
+    hooks = _EXT_CACHE.get(kind)
+    if hooks is None:
+        hooks = tuple(
+            (name, getattr(ext, kind))
+            for name, ext in CONFIG_EXTENSIONS.items()
+            if callable(getattr(ext, kind))
+            and getattr(ext, kind) is not _noop_validator
+            and getattr(ext, kind) is not _noop_defaults
+        )
+        _EXT_CACHE[kind] = hooks
+    return hooks
 
 def register_config_extension(name: str,
                               validator: Optional[Callable[[Dict[str, Any]], List[str]]] = None,
@@ -1006,12 +1572,23 @@ def register_config_extension(name: str,
     Raises:
         ValueError: If `name` is empty.
     """
-    if not isinstance(name, str) or not name:
+    if type(name) is not str:
+        # Slow path: accept str subclasses but store a plain str key
+        if not isinstance(name, str):
+            raise ValueError("extension name must be a non-empty string")
+        name = str(name)
+    if not name:
         raise ValueError("extension name must be a non-empty string")
-    CONFIG_EXTENSIONS[name] = {
-        "validator": validator or (lambda _cfg: []),
-        "defaults_provider": defaults_provider or (lambda: {}),
-    }
+    CONFIG_EXTENSIONS[name] = _ExtEntry(
+        validator or _noop_validator,
+        defaults_provider or _noop_defaults,
+    )
+    _EXT_CACHE.clear()
+    global _EXTENSION_NAMES_SORTED
+    if name not in _EXTENSION_NAMES_SORTED:
+        names = list(_EXTENSION_NAMES_SORTED)
+        bisect.insort(names, name)
+        _EXTENSION_NAMES_SORTED = tuple(names)
 
 def list_config_extensions() -> List[str]:
     """List names of registered configuration extensions.
@@ -1022,7 +1599,20 @@ def list_config_extensions() -> List[str]:
     Raises:
         None
     """
-    return sorted(CONFIG_EXTENSIONS.keys())
+    return list(_EXTENSION_NAMES_SORTED)
+
+
+def config_extensions_view() -> Mapping[str, _ExtEntry]:
+    """Return a read-only live view of the configuration extension registry.
+
+    Returns:
+        Mapping[str, _ExtEntry]: Extension name to hook entry;
+            reflects later registrations without copying.
+
+    Raises:
+        None
+    """
+    return _CONFIG_EXTENSIONS_VIEW
 
 
 CONFIG_PROCESSORS: Dict[str, List[Callable[[Dict[str, Any]], Dict[str, Any]]]] = {
@@ -1039,24 +1629,30 @@ def _normalize_legacy_fields(cfg: Dict[str, Any]) -> Dict[str, Any]:
         cfg (Dict[str, Any]): Original configuration mapping.
 
     Returns:
-        Dict[str, Any]: Configuration with legacy `name`/`version` merged.
+        Dict[str, Any]: Configuration with legacy `name`/`version` merged,
+            or `cfg` itself when no legacy field is present.
 
     Raises:
         None
     """
-    new_cfg = dict(cfg)
-    project = dict(new_cfg.get("project", {}))
-    if "name" in new_cfg and "name" not in project:
-        project["name"] = new_cfg.get("name")
-    if "version" in new_cfg and "version" not in project:
-        project["version"] = new_cfg.get("version")
+    # Specialized for the two known legacy keys: each membership test runs
+    # once and already-normalized configs (the steady state) are returned
+    # uncopied
+    has_name = "name" in cfg
+    has_version = "version" in cfg
+    if not (has_name or has_version):
+        return cfg
+
+    project = (cfg.get(_K_PROJECT) or {}).copy()
+    if has_name and "name" not in project:
+        project["name"] = cfg["name"]
+    if has_version and "version" not in project:
+        project["version"] = cfg["version"]
+    new_cfg = cfg.copy()
     if project:
-        new_cfg["project"] = project
+        new_cfg[_K_PROJECT] = project
     return new_cfg
 
-# Register default pre-processor
-CONFIG_PROCESSORS["pre_validate"].append(_normalize_legacy_fields)
-
 def register_config_processor(stage: str, processor: Callable[[Dict[str, Any]], Dict[str, Any]]) -> None:
     """Register a configuration processor for a given stage.
 
@@ -1075,4 +1671,56 @@ def register_config_processor(stage: str, processor: Callable[[Dict[str, Any]],
         raise ValueError("unsupported processor stage")
     if not callable(processor):
         raise TypeError("processor must be callable")
-    CONFIG_PROCESSORS[stage].append(processor)
\ No newline at end of file
+    CONFIG_PROCESSORS[stage].append(processor)
+
+# Register default pre-processor
+register_config_processor("pre_validate", _normalize_legacy_fields)
+
+
+# Below this many files a batch is written sequentially
+_LOCK_BATCH_PARALLEL_MIN = 4
+
+
+def save_lock_files(items: Iterable[Tuple["ConfigManager", Dict[str, Any]]],
+                    max_workers: Optional[int] = None) -> None:
+    """Write lock files for several projects in one batch.
+
+    All payloads are encoded up front, then written concurrently on a
+    thread pool so the per-file open/write/fsync/rename latencies overlap.
+    Small batches are written sequentially.
+
+    Parameters:
+        items (Iterable[Tuple[ConfigManager, Dict[str, Any]]]): Managers
+            paired with the lock data to write for each.
+        max_workers (Optional[int]): Thread pool size; defaults to the
+            executor's own default.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: If encoding or writing any lock file fails. Other files
+            in the batch are still written.
+    """
+    try:
+        jobs = [(cm, _encode_lock_data(data)) for cm, data in items]
+    except Exception as e:
+        raise ValueError(f"Failed to save lock file: {e}")
+
+    errors: List[str] = []
+    if len(jobs) < _LOCK_BATCH_PARALLEL_MIN:
+        for cm, payload in jobs:
+            try:
+                cm._write_lock_bytes(payload)
+            except OSError as e:
+                errors.append(f"{cm.lock_file}: {e}")
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(cm._write_lock_bytes, payload): cm for cm, payload in jobs}
+            for fut in as_completed(futures):
+                try:
+                    fut.result()
+                except OSError as e:
+                    errors.append(f"{futures[fut].lock_file}: {e}")
+    if errors:
+        raise ValueError("Failed to save lock file: " + "; ".join(errors))
@@ -7,17 +7,274 @@ locking, simple conflict detection, and helper resolution proposals.
 import os
 import re
 import json
+import hashlib
+import mmap
 import sys
 import shutil
-from typing import Dict, List, Optional, Any, Set, Tuple
+import threading
+from collections import deque
+from functools import lru_cache
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Any, Set, Tuple, Iterator, Callable
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    from packaging.specifiers import SpecifierSet as _SpecifierSet, InvalidSpecifier as _InvalidSpecifier
+    from packaging.version import Version as _Version, InvalidVersion as _InvalidVersion
+    from packaging.requirements import Requirement as _Requirement, InvalidRequirement as _InvalidRequirement
+    _HAVE_PACKAGING = True
+except ImportError:
+    _SpecifierSet = None
+    _HAVE_PACKAGING = False
 
 from .environment import EnvironmentManager
 from .config import ConfigManager
 from .event_bus import GLOBAL_EVENT_BUS as EVENTS
 
 
+# Leading operator of a single version specifier; a bare version means `==`
+_SPEC_OP_RE = re.compile(r"^\s*(===|==|!=|~=|>=|<=|>|<)?\s*(.*?)\s*$")
+
+# Ordering operators, applied to the result of `_compare_versions`
+_ORDER_OPS: Dict[str, Callable[[int], bool]] = {
+    ">=": lambda c: c >= 0,
+    ">": lambda c: c > 0,
+    "<=": lambda c: c <= 0,
+    "<": lambda c: c < 0,
+}
+
+
+@lru_cache(maxsize=1024)
+def _split_spec(version_spec: str) -> Tuple[str, str]:
+    """Split a single specifier into its operator and version parts.
+
+    Parameters:
+        version_spec (str): Specifier such as `>=1.0`, or a bare version.
+
+    Returns:
+        Tuple[str, str]: Operator (`==` for bare versions and `===`) and version.
+    """
+    op, version = _SPEC_OP_RE.match(version_spec).groups()
+    if not op or op == "===":
+        op = "=="
+    return op, version
+
+
+@lru_cache(maxsize=2048)
+def _spec_set(version_spec: str) -> Optional["_SpecifierSet"]:
+    """Return a parsed `SpecifierSet` for a specifier string, cached.
+
+    Parameters:
+        version_spec (str): Specifier string; a bare version means `==`.
+
+    Returns:
+        Optional[SpecifierSet]: Parsed specifier set, or None when packaging
+            is unavailable or the string is not a valid specifier.
+    """
+    if not _HAVE_PACKAGING:
+        return None
+    spec = version_spec.strip()
+    if spec and spec[0].isalnum():
+        spec = "==" + spec
+    try:
+        return _SpecifierSet(spec)
+    except _InvalidSpecifier:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_version(version: str) -> Optional["_Version"]:
+    """Return a parsed `Version` for a version string, cached.
+
+    Parameters:
+        version (str): Version string.
+
+    Returns:
+        Optional[Version]: Parsed version, or None when packaging is
+            unavailable or the string is not a valid version.
+    """
+    if not _HAVE_PACKAGING:
+        return None
+    try:
+        return _Version(version)
+    except _InvalidVersion:
+        return None
+
+
+# Value of each `Requires-Dist` header line in METADATA
+_REQUIRES_DIST_LINE_RE = re.compile(rb'^Requires-Dist:[ \t]*([^\r\n]+)', re.MULTILINE)
+
+# Runs of separators folded by PEP 503 name normalization
+_CANON_RE = re.compile(r"[-_.]+")
+
+
+def _canonical_name(name: str) -> str:
+    """Return the PEP 503 normalized form of a project name.
+
+    Parameters:
+        name (str): Project name as written.
+
+    Returns:
+        str: Lowercased name with runs of `-`, `_` and `.` folded to `-`.
+    """
+    return _CANON_RE.sub("-", name).strip().lower()
+
+
+# Separators between numeric version components for the fallback comparison
+_VER_SPLIT = re.compile(r'[^0-9]')
+
+# End of the project name in a `pip list --format=freeze` line
+# (`name==1.0` or `name @ file:///...`)
+_FREEZE_NAME_SPLIT = re.compile(r"\s*@|[=<>~!]")
+
+# `name[extras] (specifier) ; marker` from a Requires-Dist entry
+_REQUIRES_DIST_RE = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[[^\]]*\])?\s*\(?([^;()]*)\)?\s*(?:;(.*))?$")
+
+
+@lru_cache(maxsize=4096)
+def _requirement_name(requirement: str) -> Optional[str]:
+    """Return the project name of a requirement that applies to this interpreter.
+
+    With packaging available the requirement is parsed as PEP 508 (extras,
+    all specifier operators, markers) and its environment marker evaluated
+    against the running interpreter with no extras selected; otherwise only
+    the leading name is taken.
+
+    Parameters:
+        requirement (str): Requirement string such as `foo[bar]>=1; python_version < "3.12"`.
+
+    Returns:
+        Optional[str]: Project name as written, or None when the marker is
+            false here or no name can be parsed.
+    """
+    if _HAVE_PACKAGING:
+        try:
+            req = _Requirement(requirement)
+        except _InvalidRequirement:
+            pass
+        else:
+            if req.marker is not None and not req.marker.evaluate({"extra": ""}):
+                return None
+            return req.name
+    m = _REQUIRES_DIST_RE.match(requirement)
+    return m.group(1) if m else None
+
+# Run inside the target environment by `DependencyResolver._snapshot`; the
+# same enumeration as `_collect_working_set`, printed as JSON
+_WORKING_SET_CODE = r"""
+import json, re
+from importlib import metadata
+try:
+    from packaging.markers import Marker
+except Exception:
+    Marker = None
+rx = re.compile(%r)
+out = {}
+for dist in metadata.distributions():
+    name = dist.metadata["Name"]
+    if not name or name in out:
+        continue
+    reqs = []
+    for line in dist.requires or ():
+        m = rx.match(line)
+        if not m:
+            continue
+        marker = (m.group(3) or "").strip()
+        if marker:
+            if "extra" in marker:
+                continue
+            if Marker is not None:
+                try:
+                    if not Marker(marker).evaluate():
+                        continue
+                except Exception:
+                    pass
+        reqs.append((m.group(1), m.group(2).strip()))
+    out[name] = {"name": name, "version": dist.version, "requires": reqs}
+print(json.dumps(out))
+""" % _REQUIRES_DIST_RE.pattern
+
+
+def _collect_working_set() -> Dict[str, Dict[str, Any]]:
+    """Enumerate distributions of the running interpreter.
+
+    In-process counterpart of `_WORKING_SET_CODE`. Requirements that only
+    apply to extras or whose environment marker does not hold are skipped.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Mapping of distribution name to its
+            `name`, `version` and `requires` (`(name, specifier)` pairs).
+    """
+    from importlib import metadata
+    try:
+        from packaging.markers import Marker
+    except ImportError:
+        Marker = None
+    out: Dict[str, Dict[str, Any]] = {}
+    for dist in metadata.distributions():
+        name = dist.metadata["Name"]
+        if not name or name in out:
+            continue
+        reqs = []
+        for line in dist.requires or ():
+            m = _REQUIRES_DIST_RE.match(line)
+            if not m:
+                continue
+            marker = (m.group(3) or "").strip()
+            if marker:
+                if "extra" in marker:
+                    continue
+                if Marker is not None:
+                    try:
+                        if not Marker(marker).evaluate():
+                            continue
+                    except Exception:
+                        pass
+            reqs.append((m.group(1), m.group(2).strip()))
+        out[name] = {"name": name, "version": dist.version, "requires": reqs}
+    return out
+
+
+# Run inside the target environment by `get_site_packages_paths`; prints the
+# same paths as `_current_site_packages`, one per line
+_SITE_PATHS_CODE = """
+import os, site, sys
+p = [x for x in sys.path if 'site-packages' in x and os.path.isdir(x)]
+try:
+    u = site.getusersitepackages()
+    if u and os.path.isdir(u):
+        p.append(u)
+except Exception:
+    pass
+print('\\n'.join(dict.fromkeys(p)))
+"""
+
+
+def _current_site_packages() -> List[str]:
+    """Return the running interpreter's site-packages directories.
+
+    Returns:
+        List[str]: Existing site-packages paths from `sys.path` plus the user
+            site directory, de-duplicated in order.
+    """
+    import site
+    paths = [p for p in sys.path if 'site-packages' in p and os.path.isdir(p)]
+    try:
+        user_site = site.getusersitepackages()
+        if user_site and os.path.isdir(user_site):
+            paths.append(user_site)
+    except Exception:
+        pass
+    return list(dict.fromkeys(paths))
+
+
 class DependencyManager:
     """Manage project dependencies within the configured environment.
 
@@ -38,6 +295,19 @@ class DependencyManager:
         self.project_root = Path(project_root) if project_root else Path.cwd()
         self.env_manager = EnvironmentManager(self.project_root)
         self.config_manager = ConfigManager(self.project_root)
+        # Set inside `batch()` so per-package lock writes are coalesced into
+        # one write when the batch ends
+        self._defer_lock = False
+        self._lock_pending = False
+        # Digest of the lock data last written by `_generate_lock_file`
+        self._last_lock_hash: Optional[bytes] = None
+        # One `pip list` result shared by version, membership and lock
+        # queries until the environment changes
+        self._installed_list: Optional[List[Dict[str, str]]] = None
+        self._installed_cache: Optional[Dict[str, str]] = None
+        # Name-only set from the lighter freeze listing, same lifetime
+        self._installed_names: Optional[Set[str]] = None
+        self._installed_lock = threading.Lock()
         
     def _apply_pip_env(self) -> None:
         """Apply pip-related environment variables derived from configuration.
@@ -57,6 +327,51 @@ class DependencyManager:
         except Exception:
             pass
         
+    @contextmanager
+    def batch(self) -> Iterator["DependencyManager"]:
+        """Coalesce lock file updates across several install/uninstall calls.
+
+        Inside the block each operation skips its own lock file write; the
+        lock file is generated once on exit if anything changed. Nested
+        batches write only when the outermost one ends.
+
+        Returns:
+            Iterator[DependencyManager]: This manager.
+
+        Raises:
+            None
+        """
+        outer = not self._defer_lock
+        self._defer_lock = True
+        try:
+            yield self
+        finally:
+            if outer:
+                self._defer_lock = False
+                if self._lock_pending:
+                    self._lock_pending = False
+                    try:
+                        self._generate_lock_file()
+                    except Exception:
+                        pass
+
+    def _lock_changed(self) -> None:
+        """Regenerate the lock file now, or mark it pending inside a batch.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        if self._defer_lock:
+            self._lock_pending = True
+            return
+        try:
+            self._generate_lock_file()
+        except Exception:
+            pass
+
     def install(self, package: Optional[str] = None, version: Optional[str] = None, 
                 dev: bool = False, upgrade: bool = False) -> bool:
         """Install dependencies.
@@ -77,6 +392,7 @@ class DependencyManager:
         """
         # Apply pip environment variables from configuration
         self._apply_pip_env()
+        self._invalidate_installed()
 
         # Ensure virtual environment is ready and isolated
         try:
@@ -122,16 +438,19 @@ class DependencyManager:
         
         success_count = 0
         EVENTS.publish("deps:install:start", {"type": "dev" if dev else "project", "count": len(dependencies)})
-        for package, version_spec in dependencies.items():
-            if self._install_package(package, version_spec, dev=dev, upgrade=False):
-                success_count += 1
-            else:
-                print(f"Failed to install {package}")
-        
-        print(f"Successfully installed {success_count}/{len(dependencies)} {'dev-' if dev else ''}dependencies")
-        
-        # Generate lock file to record installed versions
-        self._generate_lock_file()
+        # Installs stay sequential: pip does not lock site-packages, so
+        # concurrent installs sharing dependencies can corrupt the venv
+        with self.batch():
+            for package, version_spec in dependencies.items():
+                if self._install_package(package, version_spec, dev=dev, upgrade=False):
+                    success_count += 1
+                else:
+                    print(f"Failed to install {package}")
+            
+            print(f"Successfully installed {success_count}/{len(dependencies)} {'dev-' if dev else ''}dependencies")
+            
+            # Generate lock file once, when the batch ends, to record installed versions
+            self._lock_pending = True
         EVENTS.publish("deps:install:end", {"type": "dev" if dev else "project", "success": success_count == len(dependencies)})
         
         return success_count == len(dependencies)
@@ -169,6 +488,7 @@ class DependencyManager:
         
         if result.returncode == 0:
             print(f"Successfully installed {package_spec}")
+            self._invalidate_installed()
             
             # Write to pypackage.toml after successful installation (record actual version if none specified)
             try:
@@ -179,27 +499,20 @@ class DependencyManager:
                     installed_ver = self._get_installed_version(package)
                 if installed_ver:
                     spec_to_write = installed_ver if installed_ver.startswith(("==","<=",">=","<",">","~=","!=")) else f"=={installed_ver}"
-                    # Ensure uniqueness: remove any existing dependency with the same name before writing
-                    try:
-                        self.config_manager.remove_dependency(package, dev=not dev)
-                    except Exception:
-                        pass
-                    self.config_manager.add_dependency(package, spec_to_write, dev=dev)
                 else:
                     # No version info available, write a placeholder
-                    try:
-                        self.config_manager.remove_dependency(package, dev=not dev)
-                    except Exception:
-                        pass
-                    self.config_manager.add_dependency(package, "~=0", dev=dev)
+                    spec_to_write = "~=0"
+                # Ensure uniqueness: remove any existing dependency with the same name before writing
+                try:
+                    self.config_manager.remove_dependency(package, dev=not dev)
+                except Exception:
+                    pass
+                self.config_manager.add_dependency(package, spec_to_write, dev=dev)
             except Exception as e:
                 print(f"Failed to write to pypackage.toml: {e}")
             
             # Update lock file after successful installation to ensure pypackage.lock is up-to-date
-            try:
-                self._generate_lock_file()
-            except Exception:
-                pass
+            self._lock_changed()
             
             EVENTS.publish("deps:install:package:end", {"package": package, "success": True})
             return True
@@ -212,7 +525,7 @@ class DependencyManager:
             return False
 
     def _get_installed_version(self, package: str) -> Optional[str]:
-        """Return the installed version reported by `pip show`.
+        """Return the installed version of a package.
 
         Parameters:
             package (str): Package name.
@@ -223,16 +536,63 @@ class DependencyManager:
         Raises:
             None
         """
-        try:
-            res = self.env_manager.run_pip(["show", package], capture_output=True)
-            if res.returncode != 0:
-                return None
-            for line in (res.stdout or "").splitlines():
-                if line.lower().startswith("version:"):
-                    return line.split(":", 1)[1].strip()
-        except Exception:
-            return None
-        return None
+        return self._get_installed_map().get(_canonical_name(package))
+
+    def _invalidate_installed(self) -> None:
+        """Drop the cached `pip list` result after the environment changes.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        with self._installed_lock:
+            self._installed_list = None
+            self._installed_cache = None
+            self._installed_names = None
+
+    def _load_installed(self) -> List[Dict[str, str]]:
+        """Return installed package entries, running `pip list` at most once.
+
+        Failed queries are not cached so the next call retries.
+
+        Returns:
+            List[Dict[str, str]]: Installed package entries with `name` and `version`.
+
+        Raises:
+            None
+        """
+        with self._installed_lock:
+            if self._installed_list is not None:
+                return self._installed_list
+            try:
+                result = self.env_manager.run_pip(["list", "--format=json"], capture_output=True)
+            except Exception:
+                return []
+            if result.returncode != 0:
+                return []
+            try:
+                packages = json.loads(result.stdout)
+            except json.JSONDecodeError:
+                return []
+            self._installed_list = packages
+            self._installed_cache = {
+                _canonical_name(pkg.get("name", "")): pkg.get("version", "") for pkg in packages
+            }
+            return packages
+
+    def _get_installed_map(self) -> Dict[str, str]:
+        """Return a canonical package name to installed version mapping.
+
+        Returns:
+            Dict[str, str]: Installed versions keyed by `_canonical_name`.
+
+        Raises:
+            None
+        """
+        self._load_installed()
+        return self._installed_cache or {}
     
     def uninstall(self, package: str, dev: bool = False, confirm: bool = True) -> bool:
         """Uninstall a dependency.
@@ -250,6 +610,7 @@ class DependencyManager:
         """
         # Apply pip environment variables
         self._apply_pip_env()
+        self._invalidate_installed()
         if not self.env_manager.exists():
             print("Virtual environment does not exist")
             return False
@@ -272,15 +633,14 @@ class DependencyManager:
         
         if result.returncode == 0:
             print(f"Successfully uninstalled {package}")
+            self._invalidate_installed()
+            self._last_lock_hash = None
             
             # Remove dependency from configuration file
             self.config_manager.remove_dependency(package, dev=dev)
             
             # Update lock file after successful uninstallation to ensure pypackage.lock is up-to-date
-            try:
-                self._generate_lock_file()
-            except Exception:
-                pass
+            self._lock_changed()
             
             EVENTS.publish("deps:uninstall:end", {"package": package, "success": True})
             return True
@@ -304,18 +664,40 @@ class DependencyManager:
         Raises:
             None
         """
-        result = self.env_manager.run_pip(["list", "--format=json"], capture_output=True)
-        if result.returncode != 0:
-            return False
-        
+        installed = self._installed_cache
+        if installed is None:
+            # Membership needs no versions; skip the JSON listing when the
+            # shared cache is cold
+            installed = self._installed_names
+            if installed is None:
+                installed = self._installed_names = self._installed_names_set()
+        return _canonical_name(package) in installed
+
+    def _installed_names_set(self) -> Set[str]:
+        """Return canonical names of installed packages.
+
+        Parses `pip list --format=freeze` line by line instead of decoding
+        the JSON listing.
+
+        Returns:
+            Set[str]: Installed package names, as `_canonical_name`.
+
+        Raises:
+            None
+        """
         try:
-            installed_packages = json.loads(result.stdout)
-            for pkg in installed_packages:
-                if pkg.get("name", "").lower() == package.lower():
-                    return True
-            return False
-        except json.JSONDecodeError:
-            return False
+            result = self.env_manager.run_pip(["list", "--format=freeze"], capture_output=True)
+        except Exception:
+            return set()
+        if result.returncode != 0:
+            return set()
+        names: Set[str] = set()
+        for line in (result.stdout or "").splitlines():
+            line = line.strip()
+            if not line or line.startswith(("#", "-")):
+                continue
+            names.add(_canonical_name(_FREEZE_NAME_SPLIT.split(line, 1)[0]))
+        return names
     
     def list_installed(self) -> List[Dict[str, str]]:
         """List installed packages.
@@ -331,14 +713,7 @@ class DependencyManager:
         if not self.env_manager.exists():
             return []
         
-        result = self.env_manager.run_pip(["list", "--format=json"], capture_output=True)
-        if result.returncode != 0:
-            return []
-        
-        try:
-            return json.loads(result.stdout)
-        except json.JSONDecodeError:
-            return []
+        return list(self._load_installed())
     
     def check_conflicts(self) -> List[Dict[str, Any]]:
         """Check for version conflicts against declared dependencies.
@@ -355,7 +730,7 @@ class DependencyManager:
             return []
         
         # Get installed packages
-        installed = {pkg["name"].lower(): pkg["version"] for pkg in self.list_installed()}
+        installed = self._get_installed_map()
         
         # Get project dependencies
         dependencies = self.config_manager.get_dependencies()
@@ -392,13 +767,13 @@ class DependencyManager:
         Raises:
             None
         """
-        name_lower = name.lower()
+        name_key = _canonical_name(name)
         
         # If package is not installed, no conflict
-        if name_lower not in installed:
+        if name_key not in installed:
             return None
         
-        installed_version = installed[name_lower]
+        installed_version = installed[name_key]
         
         # Simplified version comparison, actual application should use packaging.version for more accurate comparison
         if not self._version_matches(installed_version, version_spec):
@@ -424,44 +799,22 @@ class DependencyManager:
         Raises:
             None
         """
-        # This is a simplified implementation, actual application should use packaging.version
-        # Here we only handle several common version specifiers
+        spec_set = _spec_set(version_spec)
+        if spec_set is not None:
+            parsed = _parse_version(installed_version)
+            if parsed is not None:
+                return spec_set.contains(parsed, prereleases=True)
         
-        # Version equality (==1.0.0)
-        if version_spec.startswith("=="):
-            required_version = version_spec[2:]
+        # Simplified fallback when packaging is unavailable or cannot parse
+        # the versions; the operator split is cached per specifier
+        op, required_version = _split_spec(version_spec)
+        if op == "==":
             return installed_version == required_version
-        
-        # Greater than or equal version (>=1.0.0)
-        if version_spec.startswith(">="):
-            required_version = version_spec[2:]
-            return self._compare_versions(installed_version, required_version) >= 0
-        
-        # Greater than version (>1.0.0)
-        if version_spec.startswith(">"):
-            required_version = version_spec[1:]
-            return self._compare_versions(installed_version, required_version) > 0
-        
-        # Less than or equal version (<=1.0.0)
-        if version_spec.startswith("<="):
-            required_version = version_spec[2:]
-            return self._compare_versions(installed_version, required_version) <= 0
-        
-        # Less than version (<1.0.0)
-        if version_spec.startswith("<"):
-            required_version = version_spec[1:]
-            return self._compare_versions(installed_version, required_version) < 0
-        
-        # Not equal version (!=1.0.0)
-        if version_spec.startswith("!="):
-            required_version = version_spec[2:]
+        if op == "!=":
             return installed_version != required_version
-        
-        # Compatible version (~=1.0.0)
-        if version_spec.startswith("~="):
-            required_version = version_spec[2:]
-            # Simplified implementation: only require major and minor version to match,
-            # and patch version must be greater or equal to required version
+        if op == "~=":
+            # Only require major and minor version to match, and patch
+            # version must be greater or equal to required version
             installed_parts = installed_version.split(".")
             required_parts = required_version.split(".")
             
@@ -471,12 +824,14 @@ class DependencyManager:
             return (installed_parts[0] == required_parts[0] and 
                     installed_parts[1] == required_parts[1] and
                     self._compare_versions(installed_version, required_version) >= 0)
-        
-        # 如果没有操作符，默认为精确匹配 (1.0.0)
-        return installed_version == version_spec
+        return _ORDER_OPS[op](self._compare_versions(installed_version, required_version))
     
     def _compare_versions(self, v1: str, v2: str) -> int:
-        """Compare two dotted version strings numerically.
+        """Compare two version strings.
+
+        Uses PEP 440 ordering when packaging is available, so pre-releases
+        and local versions compare correctly; otherwise compares the numeric
+        components.
 
         Parameters:
             v1 (str): First version.
@@ -488,9 +843,14 @@ class DependencyManager:
         Raises:
             None
         """
-        # Simplified version comparison, actual application should use packaging.version for more accurate comparison
-        v1_parts = [int(p) for p in re.split(r'[^0-9]', v1) if p.isdigit()]
-        v2_parts = [int(p) for p in re.split(r'[^0-9]', v2) if p.isdigit()]
+        p1, p2 = _parse_version(v1), _parse_version(v2)
+        if p1 is not None and p2 is not None:
+            return (p1 > p2) - (p1 < p2)
+        
+        # Simplified numeric comparison when packaging is unavailable or a
+        # version is not PEP 440 compliant
+        v1_parts = [int(p) for p in _VER_SPLIT.split(v1) if p.isdigit()]
+        v2_parts = [int(p) for p in _VER_SPLIT.split(v2) if p.isdigit()]
         
         # Pad shorter version with zeros to equalize length
         max_len = max(len(v1_parts), len(v2_parts))
@@ -515,6 +875,7 @@ class DependencyManager:
             None
         """
         installed_packages = self.list_installed()
+        by_name = {_canonical_name(pkg["name"]): pkg["version"] for pkg in installed_packages}
         
         # Get project dependencies
         dependencies = self.config_manager.get_dependencies()
@@ -532,12 +893,7 @@ class DependencyManager:
         
         # Add regular dependencies
         for name, version_spec in dependencies.items():
-            installed_version = None
-            for pkg in installed_packages:
-                if pkg["name"].lower() == name.lower():
-                    installed_version = pkg["version"]
-                    break
-            
+            installed_version = by_name.get(_canonical_name(name))
             if installed_version:
                 lock_data["dependencies"][name] = {
                     "version": installed_version,
@@ -546,20 +902,21 @@ class DependencyManager:
         
         # Add development dependencies
         for name, version_spec in dev_dependencies.items():
-            installed_version = None
-            for pkg in installed_packages:
-                if pkg["name"].lower() == name.lower():
-                    installed_version = pkg["version"]
-                    break
-            
+            installed_version = by_name.get(_canonical_name(name))
             if installed_version:
                 lock_data["dev-dependencies"][name] = {
                     "version": installed_version,
                     "requested": version_spec
                 }
         
+        # Skip the write when the content matches what this manager last wrote
+        digest = hashlib.blake2b(json.dumps(lock_data, sort_keys=True).encode("utf-8"), digest_size=16).digest()
+        if digest == self._last_lock_hash and self.config_manager.lock_file.exists():
+            return
+        
         # Save lock file
         self.config_manager.save_lock_file(lock_data)
+        self._last_lock_hash = digest
         EVENTS.publish("deps:lock:written", {"count": len(installed_packages)})
 
 
@@ -571,6 +928,27 @@ class ResolvedPackage:
     requires: List[Tuple[str, str]]  # (dep_name, specifier)
 
 
+class _DependencyGraph(dict):
+    """Dependency graph keyed by canonical distribution name.
+
+    Keys are stored in `_canonical_name` form and every lookup (`[]`, `in`,
+    `get`) canonicalizes its argument, so `Django` and `django` resolve to
+    the same entry; `ResolvedPackage.name` keeps the name as reported.
+    """
+
+    def __init__(self, graph: Dict[str, ResolvedPackage]):
+        super().__init__((_canonical_name(k), v) for k, v in graph.items())
+
+    def __getitem__(self, name: str) -> ResolvedPackage:
+        return super().__getitem__(_canonical_name(name))
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and super().__contains__(_canonical_name(name))
+
+    def get(self, name: str, default: Optional[ResolvedPackage] = None) -> Optional[ResolvedPackage]:
+        return super().get(_canonical_name(name), default)
+
+
 @dataclass
 class Conflict:
     """Conflict report for an installed package against a specifier.
@@ -588,7 +966,7 @@ class Conflict:
 
 
 class DependencyResolver:
-    """Dependency resolver backed by `pkg_resources` for backend plugins.
+    """Dependency resolver backed by `importlib.metadata` for backend plugins.
 
     Provides helpers to install declared requirements, snapshot the working
     set into a dependency graph, detect conflicts, and propose resolution
@@ -597,6 +975,53 @@ class DependencyResolver:
 
     def __init__(self, env_manager: EnvironmentManager):
         self.env = env_manager
+        # Working-set graph reused while site-packages is unchanged
+        self._snapshot_cache: Optional[Dict[str, ResolvedPackage]] = None
+        self._snapshot_mtime: Optional[int] = None
+
+    def _site_mtime(self) -> Optional[int]:
+        """Return the mtime of the environment's site-packages directory.
+
+        Installing or removing a distribution adds or removes entries there,
+        which updates the directory mtime.
+
+        Returns:
+            Optional[int]: Modification time in nanoseconds, or None if the
+                directory cannot be inspected.
+
+        Raises:
+            None
+        """
+        try:
+            return os.stat(self.env._get_site_packages()).st_mtime_ns
+        except (OSError, AttributeError):
+            return None
+
+    def _is_current_env(self) -> bool:
+        """Return whether the environment is the running interpreter's own.
+
+        Returns:
+            bool: True if distributions can be read in-process.
+
+        Raises:
+            None
+        """
+        try:
+            return self.env.is_current_interpreter()
+        except AttributeError:
+            return False
+
+    def _invalidate_snapshot(self) -> None:
+        """Forget the cached working-set graph.
+
+        Returns:
+            None
+
+        Raises:
+            None
+        """
+        self._snapshot_cache = None
+        self._snapshot_mtime = None
 
     def install_declared(self, requirements: Dict[str, str]) -> None:
         """Install declared requirements using pip within the environment.
@@ -610,59 +1035,91 @@ class DependencyResolver:
         Raises:
             RuntimeError: If pip installation fails.
         """
-        for name, spec in (requirements or {}).items():
-            req = f"{name}{spec}" if isinstance(spec, str) and spec.strip() else str(name)
-            r = self.env.run_pip(["install", req], capture_output=True)
-            if r.returncode != 0:
-                raise RuntimeError(f"Failed to install dependency: {req}\n{r.stderr}")
+        reqs = [
+            f"{name}{spec}" if isinstance(spec, str) and spec.strip() else str(name)
+            for name, spec in (requirements or {}).items()
+        ]
+        if not reqs:
+            return
+        # One pip run resolves and installs everything together; separate
+        # concurrent runs would race on the shared site-packages
+        r = self.env.run_pip(["install", *reqs], capture_output=True)
+        self._invalidate_snapshot()
+        if r.returncode != 0:
+            raise RuntimeError(f"Failed to install dependencies: {' '.join(reqs)}\n{r.stderr}")
 
     def _snapshot(self) -> Dict[str, ResolvedPackage]:
         """Return a dependency graph snapshot of the environment.
 
-        Uses `pkg_resources` to enumerate distributions and their immediate
-        requirements, returning a mapping of package name to `ResolvedPackage`.
+        Uses `importlib.metadata` to enumerate distributions and their
+        immediate requirements, returning a mapping of package name to
+        `ResolvedPackage`. The environment is read in-process when it is the
+        running interpreter's own, otherwise through a subprocess. The graph
+        is reused while the site-packages mtime is unchanged.
 
         Returns:
-            Dict[str, ResolvedPackage]: Dependency graph.
+            Dict[str, ResolvedPackage]: Dependency graph keyed by canonical
+                name; lookups canonicalize the requested name.
 
         Raises:
             RuntimeError: If querying or parsing the working set fails.
         """
-        code = r"""
-import json
-try:
-    import pkg_resources as pr
-except Exception:
-    pr = None
-out = {}
-if pr is not None:
-    try:
-        for dist in pr.working_set:
-            name = getattr(dist, 'project_name', dist.key)
-            ver = getattr(dist, 'version', '')
-            reqs = []
+        mtime = self._site_mtime()
+        if self._snapshot_cache is not None and mtime is not None and mtime == self._snapshot_mtime:
+            return self._snapshot_cache
+        if self._is_current_env():
+            data = _collect_working_set()
+        else:
+            res = self.env.run_python(["-c", _WORKING_SET_CODE], capture_output=True)
+            if res.returncode != 0:
+                raise RuntimeError(f"Failed to query working set: {res.stderr}")
             try:
-                for r in (dist.requires() or []):
-                    reqs.append((r.project_name, str(getattr(r, 'specifier', ''))))
-            except Exception:
-                reqs = []
-            out[name] = {"name": name, "version": ver, "requires": reqs}
-    except Exception:
-        out = {}
-print(json.dumps(out))
-"""
-        res = self.env.run_python(["-c", code], capture_output=True)
-        if res.returncode != 0:
-            raise RuntimeError(f"Failed to query working set: {res.stderr}")
-        try:
-            data = json.loads(res.stdout or "{}")
-        except Exception as e:
-            raise RuntimeError(f"Failed to parse working set output: {e}\nOutput: {res.stdout}")
+                data = json.loads(res.stdout or "{}")
+            except Exception as e:
+                raise RuntimeError(f"Failed to parse working set output: {e}\nOutput: {res.stdout}")
         graph: Dict[str, ResolvedPackage] = {}
         for k, v in data.items():
             graph[k] = ResolvedPackage(name=v.get("name"), version=v.get("version"), requires=[(a, b) for a, b in (v.get("requires") or [])])
+        graph = _DependencyGraph(graph)
+        self._snapshot_cache = graph
+        self._snapshot_mtime = mtime
         return graph
 
+    def _reachable(self, graph: Dict[str, ResolvedPackage], declared: Dict[str, str]) -> Dict[str, str]:
+        """Collect the nodes reachable from the declared requirements.
+
+        Parameters:
+            graph (Dict[str, ResolvedPackage]): Working-set graph.
+            declared (Dict[str, str]): Declared requirements mapping.
+
+        Returns:
+            Dict[str, str]: Canonical name to the spelling first encountered,
+                in breadth-first discovery order.
+
+        Raises:
+            None
+        """
+        # Each node is queued once, even in diamond-shaped graphs
+        seen: Dict[str, str] = {}
+        queue: deque = deque()
+        for n in (declared or {}):
+            key = _canonical_name(n)
+            if key not in seen:
+                seen[key] = n
+                queue.append(n)
+        while queue:
+            dist = graph.get(queue.popleft())
+            if dist is None:
+                continue
+            for m, _spec in dist.requires:
+                if not m:
+                    continue
+                key = _canonical_name(m)
+                if key not in seen:
+                    seen[key] = m
+                    queue.append(m)
+        return seen
+
     def resolve_transitive(self, declared: Dict[str, str]) -> Set[str]:
         """Resolve transitive closure of declared dependencies.
 
@@ -672,22 +1129,54 @@ print(json.dumps(out))
         Returns:
             Set[str]: Set of package names including transitive dependencies.
 
+        Raises:
+            None
+        """
+        return set(self._reachable(self._snapshot(), declared).values())
+
+    def resolve_transitive_order(self, declared: Dict[str, str]) -> List[str]:
+        """Resolve the transitive closure in dependency-first order.
+
+        Orders the reachable subgraph with Kahn's algorithm so every package
+        comes after the packages it requires, e.g. for lock generation or
+        install sequencing. Members of dependency cycles follow in discovery
+        order.
+
+        Parameters:
+            declared (Dict[str, str]): Declared requirements mapping.
+
+        Returns:
+            List[str]: Package names including transitive dependencies.
+
         Raises:
             None
         """
         graph = self._snapshot()
-        names = list((declared or {}).keys())
-        selected: Set[str] = set()
-        stack: List[str] = list(names)
-        while stack:
-            n = stack.pop()
-            if n in selected:
+        reachable = self._reachable(graph, declared)
+        # Keyed by canonical name, like the graph; edges point from a
+        # requirement to the packages that depend on it
+        dependents: Dict[str, List[str]] = {k: [] for k in reachable}
+        pending: Dict[str, int] = dict.fromkeys(reachable, 0)
+        for k in reachable:
+            dist = graph.get(k)
+            if dist is None:
                 continue
-            selected.add(n)
-            for m, _spec in (graph.get(n) or ResolvedPackage(n, "", [])).requires:
-                if m and m not in selected:
-                    stack.append(m)
-        return selected
+            for m in {_canonical_name(m) for m, _spec in dist.requires if m}:
+                if m in reachable and m != k:
+                    dependents[m].append(k)
+                    pending[k] += 1
+        queue = deque(k for k in reachable if pending[k] == 0)
+        order: List[str] = []
+        while queue:
+            k = queue.popleft()
+            order.append(reachable[k])
+            for d in dependents[k]:
+                pending[d] -= 1
+                if pending[d] == 0:
+                    queue.append(d)
+        if len(order) < len(reachable):
+            order.extend(reachable[k] for k in reachable if pending[k] > 0)
+        return order
 
     def detect_conflicts(self, declared: Dict[str, str]) -> List[Conflict]:
         """Detect conflicts against declared and transitive specifiers.
@@ -701,34 +1190,47 @@ print(json.dumps(out))
         Raises:
             None
         """
+        if not _HAVE_PACKAGING:
+            return []
         graph = self._snapshot()
         conflicts: List[Conflict] = []
-        try:
-            import packaging.version as pv
-            import packaging.specifiers as ps
-        except Exception:
-            return []
         
+        # Verdicts per (installed version, specifier): identical specs such
+        # as ">=1.0" recur across many edges and are evaluated once
+        verdicts: Dict[Tuple[str, str], bool] = {}
+        reported: Set[Tuple[str, str, Optional[str]]] = set()
+
+        def violates(version: str, spec: str) -> bool:
+            key = (version, spec)
+            if key in verdicts:
+                return verdicts[key]
+            spec_set = _spec_set(spec)
+            parsed = _parse_version(version)
+            verdict = spec_set is not None and parsed is not None and not spec_set.contains(parsed)
+            verdicts[key] = verdict
+            return verdict
+
+        def report(package: str, version: str, spec: str, depender: Optional[str] = None) -> None:
+            key = (package, spec, depender)
+            if key not in reported:
+                reported.add(key)
+                conflicts.append(Conflict(package=package, installed=version, required_spec=spec, depender=depender))
+
         for name, spec in (declared or {}).items():
             dist = graph.get(name)
             if not dist or not spec:
                 continue
-            try:
-                if spec and not ps.SpecifierSet(spec).contains(pv.Version(dist.version)):
-                    conflicts.append(Conflict(package=name, installed=dist.version, required_spec=spec))
-            except Exception:
-                pass
+            if violates(dist.version, spec):
+                report(name, dist.version, spec)
         # Pass over transitive dependencies
-        for depender, dist in graph.items():
+        for key, dist in graph.items():
+            depender = dist.name or key
             for dep_name, spec in dist.requires:
                 dep = graph.get(dep_name)
                 if not dep or not spec:
                     continue
-                try:
-                    if spec and not ps.SpecifierSet(spec).contains(pv.Version(dep.version)):
-                        conflicts.append(Conflict(package=dep_name, installed=dep.version, required_spec=spec, depender=depender))
-                except Exception:
-                    pass
+                if violates(dep.version, spec):
+                    report(dep_name, dep.version, spec, depender)
         return conflicts
 
     def propose_resolutions(self, conflicts: List[Conflict]) -> List[str]:
@@ -752,6 +1254,112 @@ print(json.dumps(out))
         return actions
 
 
+# Linux `FICLONE` ioctl: share the source extents with the destination
+# (copy-on-write on Btrfs, XFS and similar)
+_FICLONE = getattr(fcntl, "FICLONE", 0x40049409) if fcntl is not None and sys.platform.startswith("linux") else None
+
+
+def _kernel_copy(src: str, dst: str) -> bool:
+    """Copy file data without moving it through user space, if possible.
+
+    Tries a reflink clone first, then `os.copy_file_range`.
+
+    Args:
+        src: Source file
+        dst: Destination file, created or truncated
+
+    Returns:
+        True if the data was copied; False if the caller should fall back
+    """
+    if _FICLONE is None and not hasattr(os, "copy_file_range"):
+        return False
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        if _FICLONE is not None:
+            try:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                return True
+            except OSError:
+                pass
+        if hasattr(os, "copy_file_range"):
+            remaining = os.fstat(fsrc.fileno()).st_size
+            try:
+                while remaining > 0:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+            except OSError:
+                return False
+            return remaining <= 0
+    return False
+
+
+def _fast_copy2(src: str, dst: str) -> str:
+    """`shutil.copy2` replacement for `copytree` that prefers kernel-side copies.
+
+    Falls back to `shutil.copyfile`, which itself uses `sendfile` where
+    available; metadata is copied as `copy2` would.
+
+    Args:
+        src: Source file
+        dst: Destination file
+
+    Returns:
+        The destination path
+    """
+    if not _kernel_copy(src, dst):
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _same_file_copy(src: str, dst: str) -> bool:
+    """Return whether `dst` already holds a `shutil.copy2` copy of `src`.
+
+    Args:
+        src: Source file
+        dst: Destination file
+
+    Returns:
+        True if `dst` is `src` itself or matches its size and mtime
+    """
+    try:
+        s, d = os.stat(src), os.stat(dst)
+    except OSError:
+        return False
+    return (s.st_dev, s.st_ino) == (d.st_dev, d.st_ino) or (
+        s.st_size == d.st_size and s.st_mtime_ns == d.st_mtime_ns
+    )
+
+
+@dataclass
+class _DistInfo:
+    """A `.dist-info` directory found in a site directory.
+
+    `requires` is filled from METADATA on first use.
+    """
+    name: str
+    version: str
+    path: str
+    requires: Optional[List[str]] = None
+
+
+@dataclass
+class _SiteIndex:
+    """Contents of one site directory, keyed for package lookups.
+
+    Attributes:
+        mtime_ns: Directory mtime the index was built from.
+        dirs: Package directories by normcased name.
+        modules: Single-file modules by normcased name without `.py`.
+        dists: Distributions by canonical project name.
+    """
+    mtime_ns: int
+    dirs: Dict[str, str] = field(default_factory=dict)
+    modules: Dict[str, str] = field(default_factory=dict)
+    dists: Dict[str, _DistInfo] = field(default_factory=dict)
+
+
 class EnhancedDependencyResolver:
     """Enhanced dependency resolver that avoids forced imports for better reliability."""
     
@@ -762,99 +1370,128 @@ class EnhancedDependencyResolver:
             env: Environment manager to work with
         """
         self.env = env
+        self._site_paths: Optional[List[str]] = None
+        # site-packages path -> directory index, see `_site_index`
+        self._site_indexes: Dict[str, _SiteIndex] = {}
         
     def get_site_packages_paths(self) -> List[str]:
         """Get all site-packages directories for the environment.
         
+        The interpreter is queried once per resolver; later calls reuse the
+        result.
+        
         Returns:
             List of site-packages directory paths
         """
-        code = """
-import sys
-import site
-import os
+        if self._site_paths is not None:
+            return list(self._site_paths)
+        try:
+            current = self.env.is_current_interpreter()
+        except AttributeError:
+            current = False
+        if current:
+            self._site_paths = _current_site_packages()
+            return list(self._site_paths)
+        result = self.env.run_python(["-c", _SITE_PATHS_CODE], capture_output=True)
+        if result.returncode == 0:
+            self._site_paths = [line.strip() for line in result.stdout.strip().split('\n') if line.strip()]
+            return list(self._site_paths)
+        return []
+    
+    def _site_index(self, site_path: str) -> Optional["_SiteIndex"]:
+        """Return the index of one site directory, rebuilding it when stale.
 
-paths = []
-# Get standard site-packages
-for path in sys.path:
-    if 'site-packages' in path and os.path.isdir(path):
-        paths.append(path)
+        The directory is listed with a single `os.scandir` pass; the index is
+        reused while the directory mtime is unchanged, which installs and
+        uninstalls update.
 
-# Get user site-packages
-try:
-    user_site = site.getusersitepackages()
-    if user_site and os.path.isdir(user_site):
-        paths.append(user_site)
-except:
-    pass
+        Args:
+            site_path: site-packages directory to index
 
-# Remove duplicates while preserving order
-seen = set()
-unique_paths = []
-for path in paths:
-    if path not in seen:
-        seen.add(path)
-        unique_paths.append(path)
+        Returns:
+            The directory index, or None if the directory cannot be read
+        """
+        try:
+            mtime = os.stat(site_path).st_mtime_ns
+        except OSError:
+            return None
+        index = self._site_indexes.get(site_path)
+        if index is not None and index.mtime_ns == mtime:
+            return index
+        index = _SiteIndex(mtime_ns=mtime)
+        try:
+            with os.scandir(site_path) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.endswith(".dist-info"):
+                        # `name-version.dist-info`: no need to open METADATA
+                        # just to learn the distribution name
+                        dist_name, _, version = name[:-len(".dist-info")].partition("-")
+                        index.dists.setdefault(_canonical_name(dist_name), _DistInfo(dist_name, version, entry.path))
+                    elif name.endswith(".py"):
+                        if entry.is_file():
+                            index.modules.setdefault(os.path.normcase(name[:-3]), entry.path)
+                    elif entry.is_dir():
+                        index.dirs.setdefault(os.path.normcase(name), entry.path)
+        except OSError:
+            return None
+        self._site_indexes[site_path] = index
+        return index
 
-for path in unique_paths:
-    print(path)
-"""
-        result = self.env.run_python(["-c", code], capture_output=True)
-        if result.returncode == 0:
-            return [line.strip() for line in result.stdout.strip().split('\n') if line.strip()]
-        return []
-    
     def find_package_location(self, package_name: str) -> Optional[str]:
         """Find the location of a package without importing it.
         
+        A package directory wins over a `.py` module in the same site
+        directory. `top_level.txt` in `.dist-info` metadata is not consulted
+        because a top-level name equal to `package_name` can only resolve to
+        these same two paths.
+        
         Args:
             package_name: Name of the package to find
             
         Returns:
             Path to the package directory/file, or None if not found
         """
-        site_packages_paths = self.get_site_packages_paths()
-        
-        for site_path in site_packages_paths:
-            if not os.path.exists(site_path):
+        found = self._locate(package_name)
+        return found[0] if found else None
+
+    def _locate(self, package_name: str) -> Optional[Tuple[str, bool]]:
+        """Find a package and report whether it is a directory.
+
+        The kind comes from the `DirEntry` type cached in the site index, so
+        callers need no extra `stat` to tell directories from modules.
+
+        Args:
+            package_name: Name of the package to find
+
+        Returns:
+            Tuple of (path, is_directory), or None if not found
+        """
+        key = os.path.normcase(package_name)
+        for site_path in self.get_site_packages_paths():
+            index = self._site_index(site_path)
+            if index is None:
                 continue
-                
-            # Check for package directory
-            pkg_dir = os.path.join(site_path, package_name)
-            if os.path.isdir(pkg_dir):
-                return pkg_dir
-                
-            # Check for single module file
-            pkg_file = os.path.join(site_path, f"{package_name}.py")
-            if os.path.isfile(pkg_file):
-                return pkg_file
-                
-            # Check for namespace packages or packages with different names
-            # Look for top_level.txt in .dist-info directories
-            for item in os.listdir(site_path):
-                if item.endswith('.dist-info'):
-                    dist_info_path = os.path.join(site_path, item)
-                    top_level_file = os.path.join(dist_info_path, 'top_level.txt')
-                    
-                    if os.path.isfile(top_level_file):
-                        try:
-                            with open(top_level_file, 'r', encoding='utf-8') as f:
-                                top_level_names = [line.strip() for line in f if line.strip()]
-                                
-                            # Check if our package name matches any top-level name
-                            for top_name in top_level_names:
-                                if top_name == package_name:
-                                    # Found matching top-level name, look for the actual package
-                                    actual_pkg_dir = os.path.join(site_path, top_name)
-                                    if os.path.isdir(actual_pkg_dir):
-                                        return actual_pkg_dir
-                                    actual_pkg_file = os.path.join(site_path, f"{top_name}.py")
-                                    if os.path.isfile(actual_pkg_file):
-                                        return actual_pkg_file
-                        except Exception:
-                            continue
-                            
+            location = index.dirs.get(key)
+            if location:
+                return location, True
+            location = index.modules.get(key)
+            if location:
+                return location, False
         return None
+
+    def find_package_locations(self, names: List[str]) -> Dict[str, Optional[str]]:
+        """Find the locations of several packages against the site indexes.
+        
+        Lookup rules match `find_package_location`.
+        
+        Args:
+            names: Names of the packages to find
+            
+        Returns:
+            Dictionary mapping each name to its directory/file path, or None if not found
+        """
+        return {name: self.find_package_location(name) for name in names}
     
     def get_package_dependencies(self, package_name: str) -> List[str]:
         """Get dependencies of a package without importing it.
@@ -865,100 +1502,177 @@ for path in unique_paths:
         Returns:
             List of dependency package names
         """
-        site_packages_paths = self.get_site_packages_paths()
+        key = _canonical_name(package_name)
         dependencies = []
+        seen: Set[str] = set()
         
-        for site_path in site_packages_paths:
-            if not os.path.exists(site_path):
+        for site_path in self.get_site_packages_paths():
+            index = self._site_index(site_path)
+            dist = index.dists.get(key) if index is not None else None
+            if dist is None:
                 continue
-                
-            # Look for .dist-info directories
-            for item in os.listdir(site_path):
-                if item.endswith('.dist-info'):
-                    # Extract package name from dist-info directory name
-                    dist_name = item.replace('.dist-info', '').split('-')[0].lower()
-                    if dist_name == package_name.lower().replace('_', '-'):
-                        dist_info_path = os.path.join(site_path, item)
-                        metadata_file = os.path.join(dist_info_path, 'METADATA')
-                        
-                        if os.path.isfile(metadata_file):
-                            try:
-                                with open(metadata_file, 'r', encoding='utf-8') as f:
-                                    content = f.read()
-                                    
-                                # Parse Requires-Dist lines
-                                for line in content.split('\n'):
-                                    if line.startswith('Requires-Dist:'):
-                                        # Extract package name from requirement
-                                        req = line.replace('Requires-Dist:', '').strip()
-                                        # Simple parsing - get package name before any version specifiers
-                                        dep_name = req.split()[0].split('>=')[0].split('==')[0].split('<')[0].split('>')[0].split('!')[0].split(';')[0].strip()
-                                        if dep_name and dep_name not in dependencies:
-                                            dependencies.append(dep_name)
-                            except Exception:
-                                continue
+            for dep_name in self._dist_requires(dist):
+                dep_key = _canonical_name(dep_name)
+                if dep_key not in seen:
+                    seen.add(dep_key)
+                    dependencies.append(dep_name)
                                 
         return dependencies
+
+    @staticmethod
+    def _dist_requires(dist: "_DistInfo") -> List[str]:
+        """Return the `Requires-Dist` names of a distribution, parsed once.
+
+        Entries whose environment marker is false for this interpreter,
+        including extras-only dependencies, are left out.
+
+        Args:
+            dist: Index entry of the distribution
+
+        Returns:
+            List of dependency package names
+        """
+        if dist.requires is not None:
+            return dist.requires
+        requires: List[str] = []
+        seen: Set[str] = set()
+        metadata_file = os.path.join(dist.path, 'METADATA')
+        try:
+            with open(metadata_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        # Requires-Dist lives in the header block; the long
+                        # description after the first blank line is skipped
+                        end = mm.find(b"\n\n")
+                        for m in _REQUIRES_DIST_LINE_RE.finditer(mm, 0, end if end != -1 else len(mm)):
+                            dep_name = _requirement_name(m.group(1).decode('utf-8', 'replace'))
+                            if dep_name is None:
+                                continue
+                            key = _canonical_name(dep_name)
+                            if key not in seen:
+                                seen.add(key)
+                                requires.append(dep_name)
+        except (OSError, ValueError):
+            pass
+        dist.requires = requires
+        return requires
     
-    def copy_package_safely(self, package_name: str, dest_dir: str, recursive: bool = True) -> bool:
+    def copy_package_safely(self, package_name: str, dest_dir: str, recursive: bool = True,
+                            _visited: Optional[Set[str]] = None) -> bool:
         """Copy a package and optionally its dependencies without importing.
         
         Args:
             package_name: Name of the package to copy
             dest_dir: Destination directory
             recursive: Whether to copy dependencies recursively
+            _visited: Canonical names already handled in this run; shared
+                across calls so common dependencies are copied once
             
         Returns:
             True if successful, False otherwise
         """
+        if _visited is None:
+            _visited = set()
         try:
-            # Find package location
-            pkg_location = self.find_package_location(package_name)
-            if not pkg_location:
-                print(f"Package {package_name} not found", file=sys.stderr)
-                return False
-                
-            # Ensure destination directory exists
-            os.makedirs(dest_dir, exist_ok=True)
-            
-            # Copy the package
-            if os.path.isdir(pkg_location):
-                # Copy directory (robust against pre-existing dest)
-                dest_path = os.path.join(dest_dir, os.path.basename(pkg_location))
-                try:
-                    shutil.copytree(pkg_location, dest_path, dirs_exist_ok=True)
-                except TypeError:
-                    # Fallback for Python < 3.8 (no dirs_exist_ok): remove if exists then copy
-                    if os.path.exists(dest_path):
-                        try:
-                            shutil.rmtree(dest_path)
-                        except FileNotFoundError:
-                            # Path might have been concurrently removed; ignore
-                            pass
-                    shutil.copytree(pkg_location, dest_path)
-                print(f"Copied package directory: {pkg_location} -> {dest_path}", file=sys.stderr)
-            else:
-                # Copy single file
-                dest_path = os.path.join(dest_dir, os.path.basename(pkg_location))
-                shutil.copy2(pkg_location, dest_path)
-                print(f"Copied package file: {pkg_location} -> {dest_path}", file=sys.stderr)
-            
-            # Recursively copy dependencies if requested
-            if recursive:
-                dependencies = self.get_package_dependencies(package_name)
-                for dep in dependencies:
-                    if dep != package_name:  # Avoid circular dependencies
-                        self.copy_package_safely(dep, dest_dir, recursive=False)
+            # The package itself comes first; with `recursive`, its whole
+            # dependency closure follows
+            names = self._closure([package_name]) if recursive else [package_name]
+            for i, name in enumerate(names):
+                key = _canonical_name(name)
+                if key in _visited:
+                    continue
+                if not self._copy_one(name, dest_dir):
+                    if i == 0:
+                        return False
+                    continue
+                _visited.add(key)
                         
             return True
             
         except Exception as e:
             print(f"Error copying package {package_name}: {e}", file=sys.stderr)
             return False
+
+    def _closure(self, roots: List[str]) -> List[str]:
+        """Return the roots and everything they depend on, transitively.
+        
+        A breadth-first walk over `get_package_dependencies`, whose
+        per-distribution results are cached in the site index.
+        
+        Args:
+            roots: Package names to start from
+            
+        Returns:
+            Package names in breadth-first order, one per canonical name
+        """
+        names: List[str] = []
+        seen: Set[str] = set()
+        queue = deque(roots)
+        while queue:
+            name = queue.popleft()
+            key = _canonical_name(name)
+            if key in seen:
+                continue
+            seen.add(key)
+            names.append(name)
+            queue.extend(self.get_package_dependencies(name))
+        return names
+
+    def _copy_one(self, package_name: str, dest_dir: str) -> bool:
+        """Copy a single package into `dest_dir`, without its dependencies.
+        
+        Args:
+            package_name: Name of the package to copy
+            dest_dir: Destination directory
+            
+        Returns:
+            True if copied or already present, False if the package was not found
+        
+        Raises:
+            OSError: If copying fails
+        """
+        # Find package location
+        found = self._locate(package_name)
+        if not found:
+            print(f"Package {package_name} not found", file=sys.stderr)
+            return False
+        pkg_location, is_dir = found
+            
+        # Ensure destination directory exists
+        os.makedirs(dest_dir, exist_ok=True)
+        dest_path = os.path.join(dest_dir, os.path.basename(pkg_location))
+        
+        # Copy the package
+        if is_dir:
+            # Copy directory (robust against pre-existing dest)
+            if os.path.exists(dest_path) and os.path.samefile(pkg_location, dest_path):
+                return True
+            try:
+                shutil.copytree(pkg_location, dest_path, copy_function=_fast_copy2, dirs_exist_ok=True)
+            except TypeError:
+                # Fallback for Python < 3.8 (no dirs_exist_ok): remove if exists then copy
+                if os.path.exists(dest_path):
+                    try:
+                        shutil.rmtree(dest_path)
+                    except FileNotFoundError:
+                        # Path might have been concurrently removed; ignore
+                        pass
+                shutil.copytree(pkg_location, dest_path, copy_function=_fast_copy2)
+            print(f"Copied package directory: {pkg_location} -> {dest_path}", file=sys.stderr)
+        elif not _same_file_copy(pkg_location, dest_path):
+            # Copy single file, unless an identical copy is already there
+            shutil.copy2(pkg_location, dest_path)
+            print(f"Copied package file: {pkg_location} -> {dest_path}", file=sys.stderr)
+        return True
     
     def resolve_and_copy_dependencies(self, requirements: List[str], dest_dir: str) -> Dict[str, bool]:
         """Resolve and copy multiple dependencies safely.
         
+        The set of packages to copy (the requirements and their transitive
+        dependencies, de-duplicated) is collected first; the copies then run
+        on a thread pool since they write distinct destination trees and are
+        bound by filesystem latency.
+        
         Args:
             requirements: List of package names to copy
             dest_dir: Destination directory
@@ -966,11 +1680,32 @@ for path in unique_paths:
         Returns:
             Dictionary mapping package names to success status
         """
-        results = {}
+        roots: List[str] = []
         
         for req in requirements:
-            # Handle version specifiers by extracting just the package name
-            package_name = req.split('>=')[0].split('==')[0].split('<')[0].split('>')[0].split('!')[0].strip()
-            results[package_name] = self.copy_package_safely(package_name, dest_dir, recursive=True)
-            
-        return results
\ No newline at end of file
+            # Handle version specifiers, extras and markers by extracting just
+            # the package name; requirements not meant for this interpreter
+            # are skipped
+            package_name = _requirement_name(req)
+            if package_name is None:
+                continue
+            roots.append(package_name)
+        # Canonical name -> name to copy, in first-seen order
+        plan: Dict[str, str] = {_canonical_name(name): name for name in self._closure(roots)}
+        
+        def copy(name: str) -> bool:
+            try:
+                return self._copy_one(name, dest_dir)
+            except Exception as e:
+                print(f"Error copying package {name}: {e}", file=sys.stderr)
+                return False
+        
+        copied: Dict[str, bool] = {}
+        if plan:
+            workers = min(32, (os.cpu_count() or 1) * 4, len(plan))
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                futures = {ex.submit(copy, name): key for key, name in plan.items()}
+                for fut in as_completed(futures):
+                    copied[futures[fut]] = fut.result()
+        
+        return {name: copied.get(_canonical_name(name), False) for name in roots}
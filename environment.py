@@ -9,26 +9,63 @@ supports activation, running Python or pip commands, and checking readiness.
 
 Environment selection supports a per-project `.venv` directory or a shared
 global directory configured via the `PACKAGE_BUILDER_VENV_DIR` environment
-variable, using a stable hash of the project path.
+variable, using a stable hash of the project path (SHA-256 by default, or
+BLAKE2b when `PACKAGE_BUILDER_VENV_HASH=blake2`).
 """
 
 import os
 import sys
-import subprocess
 import platform
 import hashlib
-import tempfile
+import functools
+import shutil
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, TYPE_CHECKING
 
 from .microvenv._create import create as microvenv_create
 from .microvenv.hooks import Options, run_after_install, register_after_install
-import urllib.request
 import time
 import logging
 
+if TYPE_CHECKING:
+    import subprocess
+
 logger = logging.getLogger("package_builder.environment")
 
+# Opt-in faster hash for global environment directory names; the default
+# keeps the SHA-256 names of environments already on disk
+VENV_HASH_ENV = "PACKAGE_BUILDER_VENV_HASH"
+
+_DOWNLOAD_CHUNK = 1 << 20
+
+
+@functools.lru_cache(maxsize=None)
+def _opener():
+    """Return the shared opener used for get-pip.py downloads.
+
+    `urllib.request` is imported here rather than at module level since only
+    the pip bootstrap needs it.
+    """
+    import urllib.request
+    return urllib.request.build_opener()
+
+
+@functools.lru_cache(maxsize=1024)
+def _project_venv_hash(project_path: str, algorithm: str = "") -> str:
+    """Return the 16-hex-digit directory name for a project's global venv.
+
+    Parameters
+    - project_path (str): Absolute project path.
+    - algorithm (str): `"blake2"` for BLAKE2b; anything else for SHA-256.
+
+    Returns
+    - str: Stable hash of the path, 16 hex characters.
+    """
+    data = project_path.encode("utf-8")
+    if algorithm == "blake2":
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+    return hashlib.sha256(data).hexdigest()[:16]
+
 class EnvironmentManager:
     """Manage Python virtual environments using microvenv.
 
@@ -50,7 +87,10 @@ class EnvironmentManager:
         self.project_root = Path(project_root) if project_root else Path.cwd()
         self.project_root = self.project_root.resolve()
         self.venv_path = self._determine_venv_path()
-        self.python_executable = self._get_venv_python_executable()
+        self._set_python_executable(self._get_venv_python_executable())
+        self._activated_env: Optional[Dict[str, str]] = None
+        self._activated_env_sig: Optional[Dict[str, str]] = None
+        self._exists_cache: Optional[bool] = None
 
     def _determine_venv_path(self) -> Path:
         """Determine the virtual environment directory for this project.
@@ -67,10 +107,20 @@ class EnvironmentManager:
         if global_venv_dir:
             global_dir = Path(global_venv_dir)
             global_dir.mkdir(parents=True, exist_ok=True)
-            hash_value = hashlib.sha256(str(self.project_root).encode("utf-8")).hexdigest()[:16]
+            hash_value = _project_venv_hash(str(self.project_root), os.environ.get(VENV_HASH_ENV, ""))
             return global_dir / hash_value
         return self.project_root / ".venv"
 
+    def _set_python_executable(self, python_executable: Path) -> None:
+        """Set the interpreter path along with its cached command prefixes.
+
+        Parameters
+        - python_executable (Path): Path to the environment's Python.
+        """
+        self.python_executable = python_executable
+        self._python_exe_str = str(python_executable)
+        self._pip_prefix = (self._python_exe_str, "-m", "pip")
+
     def _get_venv_python_executable(self) -> Path:
         """Return the environment's Python executable path.
 
@@ -94,6 +144,18 @@ class EnvironmentManager:
         return self.venv_path / "lib" / ver / "site-packages"
 
 
+    def is_current_interpreter(self) -> bool:
+        """Check whether this environment is the one running this process.
+
+        Returns
+        - bool: True if `sys.prefix` is the environment directory, so its
+          distributions can be inspected in-process.
+        """
+        try:
+            return Path(sys.prefix).resolve() == self.venv_path.resolve()
+        except OSError:
+            return False
+
     def exists(self) -> bool:
         """Check whether the virtual environment appears to exist and be valid.
 
@@ -103,9 +165,16 @@ class EnvironmentManager:
         Returns
         - bool: True if the environment exists and looks valid; otherwise False.
         """
+        # A positive result is remembered until `create` runs again; a
+        # missing environment is re-checked each time
+        if self._exists_cache:
+            return True
         scripts_dir = self.venv_path / ("Scripts" if platform.system() == "Windows" else "bin")
         cfg = self.venv_path / "pyvenv.cfg"
-        return self.venv_path.exists() and scripts_dir.exists() and cfg.exists()
+        found = self.venv_path.exists() and scripts_dir.exists() and cfg.exists()
+        if found:
+            self._exists_cache = True
+        return found
 
     def create(self, clear: bool = False) -> bool:
         """Create the virtual environment if it does not already exist.
@@ -123,12 +192,14 @@ class EnvironmentManager:
         Raises
         - None: Errors are captured and logged; `False` is returned on failure.
         """
+        self._invalidate_activated_env()
+        self._exists_cache = None
         try:
             if self.exists() and not clear:
                 return True
             if self.exists() and clear:
-                import shutil
                 shutil.rmtree(self.venv_path, ignore_errors=True)
+                self._exists_cache = None
 
             
             
@@ -141,7 +212,7 @@ class EnvironmentManager:
             # Pre-create the site-packages directory to ensure it exists
             self._get_site_packages().mkdir(parents=True, exist_ok=True)
             # Update the cached Python executable path
-            self.python_executable = self._get_venv_python_executable()
+            self._set_python_executable(self._get_venv_python_executable())
             return True
         except Exception as e:
             print(f"Failed to create virtual environment: {e}")
@@ -163,22 +234,36 @@ class EnvironmentManager:
         """
         if not self.exists():
             raise RuntimeError(f"Virtual environment does not exist: {self.venv_path}")
-        env = os.environ.copy()
+        # Reuse the last result while the process environment is unchanged
+        # (any variable, e.g. the PIP_* ones set from configuration, is
+        # passed through); callers get their own copy since they may add to it
+        sig = os.environ.copy()
+        if self._activated_env is not None and self._activated_env_sig == sig:
+            return dict(self._activated_env)
+        env = dict(sig)
         env["VIRTUAL_ENV"] = str(self.venv_path.resolve())
         scripts_dir = self.venv_path / ("Scripts" if platform.system() == "Windows" else "bin")
         path_entries = [str(scripts_dir)]
         current_path = env.get("PATH", "")
         for entry in current_path.split(os.pathsep):
-            try:
-                entry_path = Path(entry).resolve()
-            except Exception:
-                path_entries.append(entry)
+            # Match on the string first; only `Scripts`/`bin` entries cost a
+            # stat for the sibling `pyvenv.cfg`
+            base = entry.rstrip("/\\")
+            if os.path.basename(base) in ("Scripts", "bin") and os.path.exists(
+                os.path.join(os.path.dirname(base), "pyvenv.cfg")
+            ):
                 continue
-            if not (entry_path.name in ("Scripts", "bin") and (entry_path.parent / "pyvenv.cfg").exists()):
-                path_entries.append(entry)
+            path_entries.append(entry)
         env["PATH"] = os.pathsep.join(path_entries)
         env.pop("PYTHONHOME", None)
-        return env
+        self._activated_env = env
+        self._activated_env_sig = sig
+        return dict(env)
+
+    def _invalidate_activated_env(self) -> None:
+        """Drop the cached result of `activate`."""
+        self._activated_env = None
+        self._activated_env_sig = None
 
     def ensure_ready(self, clear: bool = False) -> None:
         """Ensure the environment exists and that `pip` is available.
@@ -194,6 +279,7 @@ class EnvironmentManager:
         - RuntimeError: If environment creation fails or `pip` remains
           unavailable after bootstrap.
         """
+        self._invalidate_activated_env()
         if not self.exists() or clear:
             ok = self.create(clear=clear)
             if not ok:
@@ -204,10 +290,10 @@ class EnvironmentManager:
             options = Options(env_dir=str(self.venv_path), scm_ignore_files=frozenset(["git"]))
             run_after_install(options, self.venv_path)
             # Check again after bootstrap
-            if not self._is_pip_available():
+            if not self._is_pip_available(strict=True):
                 raise RuntimeError("pip is unavailable after bootstrap")
 
-    def run_python(self, args: list, capture_output: bool = True) -> subprocess.CompletedProcess:
+    def run_python(self, args: list, capture_output: bool = True) -> "subprocess.CompletedProcess":
         """Run a Python command inside the virtual environment.
 
         Parameters
@@ -224,7 +310,8 @@ class EnvironmentManager:
         """
         if not self.exists():
             raise RuntimeError(f"Virtual environment does not exist: {self.venv_path}")
-        cmd = [str(self.python_executable)] + list(args or [])
+        import subprocess
+        cmd = [self._python_exe_str, *(args or ())]
         env = self.activate()
         return subprocess.run(
             cmd,
@@ -235,7 +322,7 @@ class EnvironmentManager:
             errors="ignore",
         )
 
-    def run_pip(self, args: list, capture_output: bool = True, stream_output: bool = False) -> subprocess.CompletedProcess:
+    def run_pip(self, args: list, capture_output: bool = True, stream_output: bool = False) -> "subprocess.CompletedProcess":
         """Run a pip command inside the virtual environment.
 
         Parameters
@@ -262,7 +349,8 @@ class EnvironmentManager:
         if stream_output and subcommand == "install" and not any(str(a).startswith("--progress-bar") for a in args):
             # pip supported options: auto/on/off/raw; use on to force progress display
             args = args + ["--progress-bar=on"]
-        cmd = [str(self.python_executable), "-m", "pip"] + args
+        import subprocess
+        cmd = [*self._pip_prefix, *args]
         env = self.activate()
         if stream_output:
             env["PYTHONUNBUFFERED"] = "1"
@@ -290,16 +378,29 @@ class EnvironmentManager:
             errors="ignore",
         )
 
-    def _is_pip_available(self) -> bool:
-        """Check whether `pip` can be invoked in the environment.
+    def _is_pip_available(self, strict: bool = False) -> bool:
+        """Check whether `pip` is installed in the environment.
+
+        By default this only looks for the `pip` package in `site-packages`,
+        which avoids starting an interpreter on every call.
+
+        Parameters
+        - strict (bool): Also verify that `python -m pip --version` runs.
 
         Returns
-        - bool: True if `python -m pip --version` succeeds; otherwise False.
+        - bool: True if `pip` is present (and runs, when `strict`); otherwise
+          False.
         """
         try:
             if not self.exists():
                 return False
-            cmd = [str(self.python_executable), "-m", "pip", "--version"]
+            pip_dir = self._get_site_packages() / "pip"
+            if not ((pip_dir / "__init__.py").is_file() or (pip_dir / "__main__.py").is_file()):
+                return False
+            if not strict:
+                return True
+            import subprocess
+            cmd = [*self._pip_prefix, "--version"]
             r = subprocess.run(cmd, env=self.activate(), capture_output=True, text=True, encoding="utf-8", errors="ignore")
             return r.returncode == 0
         except Exception:
@@ -333,6 +434,10 @@ class EnvironmentManager:
         """
         if EnvironmentManager._pip_hook_registered:
             return
+        import subprocess
+        import tempfile
+        import urllib.error
+        import urllib.request
 
         @register_after_install(order=0)
         def _install_pip(options, home_dir):
@@ -363,28 +468,38 @@ class EnvironmentManager:
                 lp = Path(env_local) / "get-pip.py"
                 if lp.exists():
                     try:
-                        import shutil
                         shutil.copy2(lp, to_path)
                         return True
                     except Exception as e:
                         logger.warning("Failed to copy local get-pip.py: %s", e)
                         return False
 
-                # Cache miss: download into cache directory
+                # Cache miss: download into a sibling .part file and rename it
+                # into place, so an interrupted download never leaves a
+                # truncated get-pip.py in the cache
+                part = lp.with_suffix(".part")
                 try:
-                    with urllib.request.urlopen(
+                    with _opener().open(
                         "https://bootstrap.pypa.io/pip/get-pip.py", timeout=60
-                    ) as resp, open(lp, "wb") as fh:
-                        while True:
-                            chunk = resp.read(64 * 1024)
-                            if not chunk:
-                                break
-                            fh.write(chunk)
-                    import shutil
+                    ) as resp:
+                        fd = os.open(part, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                        with os.fdopen(fd, "wb") as fh:
+                            content_length = resp.getheader("Content-Length")
+                            shutil.copyfileobj(resp, fh, _DOWNLOAD_CHUNK)
+                            written = fh.tell()
+                            if content_length and written != int(content_length):
+                                raise ValueError(f"download truncated: expected {content_length}, got {written}")
+                            fh.flush()
+                            os.fsync(fh.fileno())
+                    os.replace(part, lp)
                     shutil.copy2(lp, to_path)
                     return True
                 except Exception as e:
                     logger.warning("Failed to download and save get-pip.py to %s: %s", lp, e)
+                    try:
+                        part.unlink()
+                    except OSError:
+                        pass
                     return False
 
             @staticmethod
@@ -402,16 +517,11 @@ class EnvironmentManager:
                     for attempt in range(1, 4):
                         try:
                             req = urllib.request.Request(url, headers=headers)
-                            with urllib.request.urlopen(req, timeout=60) as resp, open(to_path, "wb") as fh:
+                            with _opener().open(req, timeout=60) as resp, open(to_path, "wb") as fh:
                                 content_length = resp.getheader("Content-Length")
                                 target = int(content_length) if content_length else None
-                                written = 0
-                                while True:
-                                    chunk = resp.read(64 * 1024)
-                                    if not chunk:
-                                        break
-                                    fh.write(chunk)
-                                    written += len(chunk)
+                                shutil.copyfileobj(resp, fh, _DOWNLOAD_CHUNK)
+                                written = fh.tell()
                                 if target is not None and written != target:
                                     raise ValueError(f"download truncated: expected {target}, got {written}")
                             return True
@@ -431,10 +541,11 @@ class EnvironmentManager:
                         logger.error("pip bootstrap failed: unable to download or obtain get-pip.py")
                         return
 
-                    res = subprocess.run([os.fsdecode(py), os.fsdecode(gp)], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding="utf-8", errors="ignore")
+                    py_str = os.fsdecode(py)
+                    res = subprocess.run([py_str, os.fsdecode(gp)], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding="utf-8", errors="ignore")
                     if res.returncode == 0:
                         logger.info("pip installed successfully via get-pip.py")
-                        up = subprocess.run([os.fsdecode(py), "-m", "pip", "install", "-U", "pip", "setuptools", "wheel"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding="utf-8", errors="ignore")
+                        up = subprocess.run([py_str, "-m", "pip", "install", "-U", "pip", "setuptools", "wheel"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding="utf-8", errors="ignore")
                         if up.returncode != 0:
                             logger.warning("Failed to upgrade pip/setuptools/wheel: %s", up.stderr)
                     else:
@@ -475,34 +586,6 @@ class EnvironmentManager:
         if not global_venv_dir:
             return Path(project_path) / ".venv"
         project_path_abs = Path(project_path).resolve()
-        hash_value = hashlib.sha256(str(project_path_abs).encode("utf-8")).hexdigest()[:16]
+        hash_value = _project_venv_hash(str(project_path_abs), os.environ.get(VENV_HASH_ENV, ""))
         venv_path = Path(global_venv_dir) / hash_value
         return venv_path if venv_path.exists() else None
-    
-    @classmethod
-    def find_venv_by_project_path(cls, project_path: str) -> Optional[Path]:
-        """Find the virtual environment corresponding to a project path.
-
-        When a global venv directory is configured, a stable hash of the
-        resolved project path is used as the environment directory name.
-        Otherwise, `.venv` under the project directory is returned.
-
-        Parameters
-        - project_path (str): Path to the project directory.
-
-        Returns
-        - Optional[Path]: Environment path if it exists under the global
-          directory; otherwise the local `.venv` path or None when not found.
-        """
-        global_venv_dir = os.environ.get(cls.GLOBAL_VENV_DIR_ENV)
-        if not global_venv_dir:
-            # Default to local .venv when no global directory is configured
-            return Path(project_path) / ".venv"
-        
-        # Compute hash of project path to find environment
-        project_path_abs = Path(project_path).resolve()
-        project_path_str = str(project_path_abs)
-        hash_value = hashlib.sha256(project_path_str.encode('utf-8')).hexdigest()[:16]
-        
-        venv_path = Path(global_venv_dir) / hash_value
-        return venv_path if venv_path.exists() else None
\ No newline at end of file
@@ -5,8 +5,41 @@ components in the package builder. Callers can subscribe callable
 handlers per event name and publish events with arbitrary payloads.
 """
 
-from typing import Callable, Dict, List, Any
-from threading import RLock
+import sys
+from typing import Callable, Dict, Iterable, Tuple, Any
+from threading import Lock
+
+# Events with more handlers than this dispatch through a plain loop
+_MAX_UNROLLED_HANDLERS = 16
+
+
+def _make_dispatcher(handlers: Tuple[Callable[[Any], None], ...]) -> Callable[[Any], None]:
+    """Build a function calling each handler in turn, suppressing errors.
+
+    For small handler tuples the calls are unrolled into generated source,
+    which avoids the loop and per-iteration lookups on every publish.
+
+    Parameters:
+        handlers (Tuple[Callable[[Any], None], ...]): Handlers in call order.
+
+    Returns:
+        Callable[[Any], None]: Dispatcher taking the event payload.
+    """
+    if len(handlers) > _MAX_UNROLLED_HANDLERS:
+        def dispatch(payload: Any) -> None:
+            for h in handlers:
+                try:
+                    h(payload)
+                except Exception:
+                    pass
+        return dispatch
+    lines = ["def dispatch(payload):", "    pass"]
+    namespace: Dict[str, Any] = {}
+    for i, h in enumerate(handlers):
+        namespace[f"h{i}"] = h
+        lines += ["    try:", f"        h{i}(payload)", "    except Exception:", "        pass"]
+    exec("\n".join(lines), namespace)
+    return namespace["dispatch"]
 
 
 class EventBus:
@@ -15,11 +48,19 @@ class EventBus:
     Handlers are invoked with a single argument: the published payload.
     Exceptions raised by handlers are suppressed to avoid affecting other
     subscribers.
+
+    The subscriber table is copy-on-write: `subscribe` and `unsubscribe`
+    build a new mapping under the lock and rebind `_subscribers` in one
+    assignment, so `publish` reads a consistent snapshot without locking.
+    Alongside it, `_dispatchers` holds one generated dispatch function per
+    event, rebuilt only for the event whose subscribers changed.
     """
 
     def __init__(self) -> None:
-        self._subscribers: Dict[str, List[Callable[[Any], None]]] = {}
-        self._lock = RLock()
+        self._subscribers: Dict[str, Tuple[Callable[[Any], None], ...]] = {}
+        self._dispatchers: Dict[str, Callable[[Any], None]] = {}
+        # Writers never re-enter the bus while holding it
+        self._lock = Lock()
 
     def subscribe(self, event: str, handler: Callable[[Any], None]) -> None:
         """Register a handler for an event name.
@@ -34,8 +75,12 @@ class EventBus:
         Raises:
             None
         """
+        # Interned keys let lookups by literal event names match on identity
+        event = sys.intern(event)
         with self._lock:
-            self._subscribers.setdefault(event, []).append(handler)
+            subscribers = dict(self._subscribers)
+            subscribers[event] = subscribers.get(event, ()) + (handler,)
+            self._swap(subscribers, event)
 
     def unsubscribe(self, event: str, handler: Callable[[Any], None]) -> None:
         """Remove a previously registered handler.
@@ -51,10 +96,31 @@ class EventBus:
             None
         """
         with self._lock:
-            handlers = self._subscribers.get(event, [])
-            self._subscribers[event] = [h for h in handlers if h is not handler]
-            if not self._subscribers[event]:
-                self._subscribers.pop(event, None)
+            current = self._subscribers.get(event, ())
+            handlers = tuple(h for h in current if h is not handler)
+            if len(handlers) == len(current):
+                # Not subscribed: keep the current snapshot
+                return
+            subscribers = dict(self._subscribers)
+            if handlers:
+                subscribers[event] = handlers
+            else:
+                subscribers.pop(event, None)
+            self._swap(subscribers, event)
+
+    def _swap(self, subscribers: Dict[str, Tuple[Callable[[Any], None], ...]], event: str) -> None:
+        """Publish a new subscriber mapping in which only *event* changed.
+
+        Called with the lock held.
+        """
+        dispatchers = dict(self._dispatchers)
+        handlers = subscribers.get(event)
+        if handlers:
+            dispatchers[event] = _make_dispatcher(handlers)
+        else:
+            dispatchers.pop(event, None)
+        self._dispatchers = dispatchers
+        self._subscribers = subscribers
 
     def publish(self, event: str, payload: Any = None) -> None:
         """Emit an event, invoking all subscribed handlers.
@@ -69,14 +135,29 @@ class EventBus:
         Raises:
             None
         """
-        with self._lock:
-            handlers = list(self._subscribers.get(event, []))
-        for h in handlers:
-            try:
-                h(payload)
-            except Exception:
-                # Handler errors are suppressed to protect other subscribers.
-                pass
+        # Handler errors are suppressed to protect other subscribers.
+        dispatch = self._dispatchers.get(event)
+        if dispatch is not None:
+            dispatch(payload)
+
+
+    def publish_many(self, events: Iterable[Tuple[str, Any]]) -> None:
+        """Emit a batch of events in order against one subscriber snapshot.
+
+        Parameters:
+            events (Iterable[Tuple[str, Any]]): `(event, payload)` pairs.
+
+        Returns:
+            None: This method does not return a value.
+
+        Raises:
+            None
+        """
+        dispatchers = self._dispatchers
+        for event, payload in events:
+            dispatch = dispatchers.get(event)
+            if dispatch is not None:
+                dispatch(payload)
 
 
 GLOBAL_EVENT_BUS = EventBus()
\ No newline at end of file
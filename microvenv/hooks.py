@@ -11,32 +11,38 @@ and robust error handling with logging.
 
 from __future__ import annotations
 
+import bisect
 import logging
 import traceback
+import weakref
 from dataclasses import dataclass, field
-from typing import Any, Callable, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger("microvenv.hooks")
 
 
 @dataclass(order=True)
 class _HookEntry:
+    # Entries sort by (order, index); the registration index keeps ties FIFO
     order: int
-    func: Callable
-    index: int = field(compare=False, default=0)
+    func: Callable = field(compare=False)
+    index: int = field(default=0)
 
 
-# Registries
+# Registries, each kept sorted by `_register`
 _extend_parser_hooks: List[_HookEntry] = []
 _adjust_options_hooks: List[_HookEntry] = []
 _after_install_hooks: List[_HookEntry] = []
 _registration_seq: int = 0
+# Snapshot per registry (keyed by id), dropped when that registry changes
+_sorted_cache: Dict[int, Tuple[_HookEntry, ...]] = {}
 
 
 def _register(registry: List[_HookEntry], func: Callable, *, order: int = 0) -> None:
     global _registration_seq
     entry = _HookEntry(order=order, func=func, index=_registration_seq)
-    registry.append(entry)
+    bisect.insort(registry, entry)
+    _sorted_cache.pop(id(registry), None)
     _registration_seq += 1
 
 
@@ -94,6 +100,31 @@ class Options:
     scm_ignore_files: Iterable[str]
 
 
+# Option strings in use per parser, shared by every SafeParser wrapping it,
+# stored with the action count they were read at; options added to the
+# parser directly change that count and force a rescan
+_used_options_cache: "weakref.WeakKeyDictionary[Any, Tuple[int, set]]" = weakref.WeakKeyDictionary()
+
+
+def _used_option_strings(parser) -> set:
+    actions = getattr(parser, "_actions", [])
+    try:
+        cached = _used_options_cache.get(parser)
+    except TypeError:  # not weak-referenceable; scan every time
+        cached = None
+    if cached is not None and cached[0] == len(actions):
+        return cached[1]
+    used = set()
+    for action in actions:
+        for opt in getattr(action, "option_strings", ()):  # type: ignore[attr-defined]
+            used.add(opt)
+    try:
+        _used_options_cache[parser] = (len(actions), used)
+    except TypeError:
+        pass
+    return used
+
+
 class SafeParser:
     """Adapter to prevent option conflicts when hooks add CLI arguments.
 
@@ -102,28 +133,35 @@ class SafeParser:
 
     def __init__(self, parser):
         self._parser = parser
-        # Track used option strings to guard against conflict
-        used = set()
-        for action in getattr(parser, "_actions", []):
-            for opt in getattr(action, "option_strings", ()):  # type: ignore[attr-defined]
-                used.add(opt)
-        self._used_option_strings = used
 
     def add_argument(self, *name_or_flags, **kwargs):
-        conflicts = set(name_or_flags) & self._used_option_strings
+        # Track used option strings to guard against conflict; the set is
+        # shared per parser and rebuilt only when its actions change
+        used = _used_option_strings(self._parser)
+        conflicts = set(name_or_flags) & used
         if conflicts:
             raise ValueError(f"Argument conflict with existing options: {sorted(conflicts)}")
         action = self._parser.add_argument(*name_or_flags, **kwargs)
         for opt in getattr(action, "option_strings", ()):  # type: ignore[attr-defined]
-            self._used_option_strings.add(opt)
+            used.add(opt)
+        try:
+            _used_options_cache[self._parser] = (len(getattr(self._parser, "_actions", [])), used)
+        except TypeError:
+            pass
         return action
 
     def __getattr__(self, name):
         return getattr(self._parser, name)
 
 
-def _sorted_hooks(registry: List[_HookEntry]) -> List[_HookEntry]:
-    return sorted(registry)  # by order then by registration index
+def _sorted_hooks(registry: List[_HookEntry]) -> Tuple[_HookEntry, ...]:
+    # The registry is already in order; the snapshot only guards against
+    # hooks that register further hooks while the registry is being run
+    hooks = _sorted_cache.get(id(registry))
+    if hooks is None:
+        hooks = tuple(registry)
+        _sorted_cache[id(registry)] = hooks
+    return hooks
 
 
 def run_extend_parser(parser) -> None:
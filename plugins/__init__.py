@@ -9,9 +9,10 @@ the `[tool]` table. Plugins are decoupled via an event bus and lifecycle hooks
 
 from __future__ import annotations
 
+import copy
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 
 try:
     import tomllib  # Python 3.11+
@@ -21,6 +22,34 @@ except Exception:
 from ..event_bus import GLOBAL_EVENT_BUS
 from ..environment import EnvironmentManager
 
+# Parsed `pypackage.toml` files shared by the manager and plugins:
+# resolved path -> (st_mtime_ns, st_size, parsed mapping)
+_TOML_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+def _load_toml(path: Path) -> Dict[str, Any]:
+    """Parse a TOML file, reusing the previous parse while it is unchanged.
+
+    Parameters
+    - path (Path): TOML file to read.
+
+    Returns
+    - Dict[str, Any]: Parsed mapping; a private copy the caller may mutate.
+
+    Raises
+    - OSError: If the file cannot be read.
+    - tomllib.TOMLDecodeError: If the file is not valid TOML.
+    """
+    st = path.stat()
+    key = str(path.resolve())
+    cached = _TOML_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return copy.deepcopy(cached[2])
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
+    _TOML_CACHE[key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(data))
+    return data
+
 
 class Plugin:
     """Base class for plugins.
@@ -35,6 +64,8 @@ class Plugin:
     """
 
     name: str = ""
+    # Subclasses without their own `__slots__` still get an instance dict
+    __slots__ = ("config", "env_manager")
 
     def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
         self.config = config or {}
@@ -126,8 +157,7 @@ class PluginManager:
         candidate = self.project_root / "pypackage.toml"
         if candidate.exists():
             try:
-                with open(candidate, "rb") as f:
-                    data = tomllib.load(f)
+                data = _load_toml(candidate)
             except Exception:
                 data = {}
 
@@ -189,6 +219,17 @@ class PluginManager:
         except Exception:
             pass
 
+    def emit_many(self, events: Iterable[Tuple[str, Any]]) -> None:
+        """Publish a batch of `(event, payload)` pairs via the event bus.
+
+        Handlers registered while the batch is being dispatched only see
+        later batches.
+        """
+        try:
+            GLOBAL_EVENT_BUS.publish_many(events)
+        except Exception:
+            pass
+
     def _on_any_event(self, payload: Any) -> None:
         """Wildcard subscription handler.
 
@@ -1,10 +1,139 @@
 from __future__ import annotations
 
 import ast
+import os
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
-from . import Plugin
+from . import Plugin, _load_toml
+
+# Statement-list fields that can hold nested statements (and so imports)
+_BODY_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+
+def _module_imports(source: bytes, filename: str) -> Set[str]:
+    """Collect top-level names imported anywhere in a module.
+
+    Only statement bodies are visited: imports are statements, so the
+    expression subtrees that make up most of a syntax tree are skipped.
+
+    Parameters
+    - source (bytes): Module source; `ast.parse` decodes it per PEP 263.
+    - filename (str): Filename reported in syntax errors.
+
+    Returns
+    - Set[str]: First component of every imported module name.
+
+    Raises
+    - SyntaxError: If the module cannot be parsed.
+    """
+    imported: Set[str] = set()
+    stack: List[ast.AST] = [ast.parse(source, filename=filename)]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Import):
+            for n in node.names:
+                imported.add(n.name.split(".")[0])
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                imported.add(node.module.split(".")[0])
+        else:
+            for name in _BODY_FIELDS:
+                stack.extend(getattr(node, name, ()))
+    return imported
+
+
+# An import statement starting a line at any indentation: `from X import`
+# (or `from .X import`) captures X, `import A, B as C` captures the rest of the line
+_IMPORT_LINE_RE = re.compile(
+    rb"^[ \t\f]*(?:from[ \t]+\.*([A-Za-z_][\w.]*)[ \t]+import\b|import[ \t]+([^\r\n#;]+))",
+    re.MULTILINE,
+)
+# Imports the line scan cannot read reliably: after `;` or a one-line
+# compound statement's `:`, or continued lines
+_AMBIGUOUS_IMPORT_RE = re.compile(
+    rb"[;:][ \t]*(?:import|from)[ \t]|^[ \t\f]*(?:import|from)\b[^\r\n#]*\\\r?$", re.MULTILINE
+)
+_CONTINUATION_RE = re.compile(rb"\\\r?\n")
+# Every `import` keyword, matched or not; the strict scan gives up when some
+# occurrence is not part of a line `_IMPORT_LINE_RE` read
+_IMPORT_WORD_RE = re.compile(rb"\bimport\b")
+_BOM = b"\xef\xbb\xbf"
+_MODULE_NAME_RE = re.compile(r"[A-Za-z_][\w.]*\Z")
+
+
+def _scan_imports(source: bytes, filename: str, strict: bool = True) -> Optional[Set[str]]:
+    """Collect imported top-level names with a line scan instead of a parse.
+
+    Matches inside strings only add names, which errs towards keeping a
+    dependency; None is returned for sources the scan cannot read reliably.
+
+    Parameters
+    - source (bytes): Module source.
+    - filename (str): Unused; mirrors `_module_imports`.
+    - strict (bool): When False, never give up: unreadable import lines are
+      skipped instead of returning None.
+
+    Returns
+    - Optional[Set[str]]: First component of every imported module name,
+      or None when the caller should fall back to `_module_imports`.
+    """
+    if source.startswith(_BOM):
+        source = source[len(_BOM):]
+    if strict:
+        if _AMBIGUOUS_IMPORT_RE.search(source):
+            return None
+    else:
+        # Join continued lines so `from X \` + `import y` still reads as X
+        source = _CONTINUATION_RE.sub(b" ", source)
+    matches = list(_IMPORT_LINE_RE.finditer(source))
+    if strict and len(matches) != len(_IMPORT_WORD_RE.findall(source)):
+        return None
+    imported: Set[str] = set()
+    for m in matches:
+        module, names = m.groups()
+        if module is not None:
+            imported.add(module.split(b".")[0].decode("ascii"))
+            continue
+        for part in names.decode("utf-8", "replace").split(","):
+            name = part.split(None, 1)[0] if part.strip() else ""
+            if not _MODULE_NAME_RE.match(name):
+                if strict:
+                    return None
+                continue
+            imported.add(name.split(".")[0])
+    return imported
+
+
+# Sources above this size (typically generated code) are never handed to
+# `ast.parse`, whose time and memory grow steeply on such files
+_MAX_PARSE_BYTES = 1_000_000
+
+
+def _file_imports(path: str) -> Set[str]:
+    """Return the imports of one file, empty if it cannot be read or parsed."""
+    try:
+        with open(path, "rb") as f:
+            source = f.read()
+        if len(source) > _MAX_PARSE_BYTES:
+            return _scan_imports(source, path, strict=False) or set()
+        imported = _scan_imports(source, path)
+        return imported if imported is not None else _module_imports(source, path)
+    except Exception:
+        return set()
+
+
+# Directory names never scanned for imports
+_EXCLUDE_DIRS = frozenset({"tests", "__pycache__", ".venv", "build"})
+
+def _iter_sources(root: Path) -> Iterator[str]:
+    """Yield `.py` files under *root*, pruning excluded directories unvisited."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in _EXCLUDE_DIRS]
+        for name in filenames:
+            if name.endswith(".py"):
+                yield os.path.join(dirpath, name)
 
 
 class DependencyCleanupPlugin(Plugin):
@@ -22,6 +151,10 @@ class DependencyCleanupPlugin(Plugin):
     def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
         super().__init__(config)
         self.project_root: Path = Path.cwd()
+        # Project ConfigManager reused across lifecycle events, with the
+        # (st_mtime_ns, st_size) of the file its loaded config reflects
+        self._cfgm = None
+        self._cfg_stamp: Optional[Tuple[int, int]] = None
 
     def activate(self, manager) -> None:
         """Record the project root for source scanning."""
@@ -72,20 +205,22 @@ class DependencyCleanupPlugin(Plugin):
         if dry_run or not remove or not to_remove:
             return True
 
-        for pkg in to_remove:
-            self._pip_uninstall(pkg)
+        self._pip_uninstall_many(to_remove)
 
         try:
-            from ..config import ConfigManager
-            cfgm = ConfigManager(str(self.project_root))
+            cfgm = self._config_manager()
             file_cfg = cfgm.load()
             file_deps = file_cfg.get("dependencies", {}) or {}
             if isinstance(file_deps, dict):
+                changed = False
                 for pkg in to_remove:
                     if pkg in file_deps:
                         file_deps.pop(pkg, None)
+                        changed = True
                 file_cfg["dependencies"] = file_deps
-                cfgm.save(file_cfg)
+                if changed:
+                    cfgm.save(file_cfg)
+                    self._cfg_stamp = self._config_stamp(cfgm)
             ctx_deps = config.get("dependencies", {}) or {}
             if isinstance(ctx_deps, dict):
                 for pkg in to_remove:
@@ -101,7 +236,7 @@ class DependencyCleanupPlugin(Plugin):
 
         The scanner walks `.py` files under detected source roots, collects
         top-level imports, and flags declared dependencies that are not
-        referenced.
+        referenced. It stops early once every dependency has been seen.
         """
         roots: List[Path] = []
         py_mod = self._find_python_module_root()
@@ -117,27 +252,64 @@ class DependencyCleanupPlugin(Plugin):
         if not roots:
             roots = [self.project_root]
 
-        imported: Set[str] = set()
+        # Dependencies not yet seen imported; the walk stops once it is empty
+        remaining: Set[str] = {d.split("[")[0] for d in deps}
         for root in roots:
-            for py in root.rglob("*.py"):
-                if any(s in str(py) for s in ("tests", "__pycache__")):
-                    continue
-                try:
-                    with open(py, "r", encoding="utf-8") as f:
-                        tree = ast.parse(f.read(), filename=str(py))
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.Import):
-                            for n in node.names:
-                                imported.add(n.name.split(".")[0])
-                        elif isinstance(node, ast.ImportFrom):
-                            if node.module:
-                                imported.add(node.module.split(".")[0])
-                except Exception:
-                    continue
-
-        unused = [d for d in deps if d.split("[")[0] not in imported]
+            for path in _iter_sources(root):
+                remaining -= _file_imports(path)
+                if not remaining:
+                    break
+            if not remaining:
+                break
+
+        unused = [d for d in deps if d.split("[")[0] in remaining]
         return unused
 
+    def _config_manager(self):
+        """Return the project's ConfigManager, reloading if the file changed.
+
+        Returns
+        - ConfigManager: Manager whose loaded config matches the file on disk.
+        """
+        if self._cfgm is None:
+            from ..config import ConfigManager
+            self._cfgm = ConfigManager(str(self.project_root))
+        stamp = self._config_stamp(self._cfgm)
+        if stamp != self._cfg_stamp:
+            # Drop the in-memory copy; the next load() re-reads the file
+            self._cfgm._config = None
+            self._cfg_stamp = stamp
+        return self._cfgm
+
+    @staticmethod
+    def _config_stamp(cfgm) -> Optional[Tuple[int, int]]:
+        """Return `(st_mtime_ns, st_size)` of the config file, or None if absent."""
+        try:
+            st = cfgm.config_file.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _pip_uninstall_many(self, pkgs: List[str]) -> None:
+        """Uninstall packages with a single pip run.
+
+        If the batch fails, each package is retried on its own so one bad
+        name does not keep the others installed.
+        """
+        if len(pkgs) == 1:
+            self._pip_uninstall(pkgs[0])
+            return
+        try:
+            self._ensure_env()
+            if self.env_manager:
+                r = self.env_manager.run_pip(["uninstall", "-y", *pkgs], capture_output=False)
+                if r.returncode == 0:
+                    return
+        except Exception:
+            pass
+        for pkg in pkgs:
+            self._pip_uninstall(pkg)
+
     def _pip_uninstall(self, pkg: str) -> None:
         """Uninstall a package using the project's virtual environment."""
         try:
@@ -153,12 +325,7 @@ class DependencyCleanupPlugin(Plugin):
         if not candidate.exists():
             return None
         try:
-            import tomllib  # py311
-        except Exception:
-            import tomli as tomllib  # type: ignore
-        try:
-            with open(candidate, "rb") as f:
-                data = tomllib.load(f)
+            data = _load_toml(candidate)
             build = data.get("build", {}) or {}
             python = build.get("python", {}) or {}
             module = python.get("module")
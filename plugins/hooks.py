@@ -4,13 +4,48 @@ import importlib
 import importlib.util
 import os
 import shlex
+import shutil
 import subprocess
+import sys
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 import logging
 
 from . import Plugin
 
+# Hook scripts loaded from a file path, shared across plugin instances:
+# resolved path -> (st_mtime_ns, executed module)
+_SCRIPT_MODULES: Dict[str, Tuple[int, ModuleType]] = {}
+
+
+# Lifecycle events a hook script may define `before_<event>` / `after_<event>` for
+_KNOWN_EVENTS = frozenset({"build", "venv", "deps_install", "backend_prepare", "backend_build"})
+_BEFORE_PREFIX = "before_"
+_AFTER_PREFIX = "after_"
+
+# Context parameters shared across events by `_sync_params`
+_SHARED_KEYS = ("output", "temp_dir")
+_MISSING = object()
+_EMPTY: Tuple[Any, ...] = ()
+
+# Parsed command kinds, see `_precompile_cmds`
+_KIND_OTHER = 0
+_KIND_PYTHON = 1
+_KIND_PIP = 2
+_KIND_INVALID = 3
+# Common command heads classified by one lookup; anything else goes
+# through the general rules in `_precompile_cmds`
+_KIND_BY_HEAD = {"python": _KIND_PYTHON, "python3": _KIND_PYTHON, "pip": _KIND_PIP}
+
+
+def _cached_import(name: str) -> ModuleType:
+    """Import a module by name, skipping the import machinery once loaded."""
+    modules = sys.modules
+    if name not in modules:
+        importlib.import_module(name)
+    return modules[name]
+
 
 class HookPlugin(Plugin):
     """Build-lifecycle Hook plugin (new implementation, no backward compatibility).
@@ -24,6 +59,8 @@ class HookPlugin(Plugin):
     - `pre`: Dict[event, List[str]] — commands to run before the event
     - `post`: Dict[event, List[str]] — commands to run after the event
     - `abort_on_failure`: bool (default True) — abort build if pre-command fails
+    - `parallel_post`: bool (default False) — run an event's post commands concurrently
+      when none of them is a `python` or `pip` command
     - `script`: str — module name or project-relative `.py` path
 
     Supported events: `build`, `venv`, `deps_install`, `backend_prepare`, `backend_build`.
@@ -31,14 +68,37 @@ class HookPlugin(Plugin):
     """
 
     name = "hooks"
+    __slots__ = (
+        "project_root", "_root_str", "_py_hooks_before", "_py_hooks_after", "_shared_params",
+        "_active_before", "_active_after", "_log_ctx", "_log_list", "_last_validated",
+        "_existing_dirs", "_exe_cache", "_parsed_cmds", "_logger",
+    )
 
     def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
         super().__init__(config)
         self.project_root: Path = Path.cwd()
-        self._py_hooks_before: Dict[str, List[Callable[[Dict[str, Any]], Any]]] = {}
-        self._py_hooks_after: Dict[str, List[Callable[[Dict[str, Any]], Any]]] = {}
+        # str(project_root), kept in step with it for per-event use
+        self._root_str: str = str(self.project_root)
+        # event -> hooks, frozen to tuples once discovery is done
+        self._py_hooks_before: Dict[str, Tuple[Callable[[Dict[str, Any]], Any], ...]] = {}
+        self._py_hooks_after: Dict[str, Tuple[Callable[[Dict[str, Any]], Any], ...]] = {}
         # Shared parameters captured from any event context and propagated to others
         self._shared_params: Dict[str, Any] = {}
+        # Events with work per phase, set by `activate`; None runs every event
+        self._active_before: Optional[frozenset] = None
+        self._active_after: Optional[frozenset] = None
+        # Context last logged to and its `plugin_logs[name]` list, see `_bind_log_list`
+        self._log_ctx: Optional[Dict[str, Any]] = None
+        self._log_list: List[Dict[str, str]] = []
+        # Last values checked by `_validate_params`, which skips them on repeat
+        self._last_validated: Dict[str, Any] = {}
+        # Output parent directories already seen to exist; only positive
+        # results are kept, so a directory created later is still picked up
+        self._existing_dirs: Set[str] = set()
+        # (command name, PATH) -> absolute executable, see `_spawn`
+        self._exe_cache: Dict[Tuple[str, str], Optional[str]] = {}
+        # (phase, event) -> ((kind, argv, args), ...), split once by `_precompile_cmds`
+        self._parsed_cmds: Optional[Dict[Tuple[str, str], Tuple[Tuple[int, List[str], List[str]], ...]]] = None
         self._logger = logging.getLogger("package_builder.plugins.hooks")
         if not self._logger.handlers:
             h = logging.StreamHandler()
@@ -54,29 +114,34 @@ class HookPlugin(Plugin):
         except Exception:
             pass
         self.project_root = manager.project_root
+        self._root_str = str(self.project_root)
+        self._precompile_cmds()
         self._discover_python_script()
+        # Events with a Python hook or commands; the others take a fast path
+        self._active_before = frozenset(self._py_hooks_before) | {ev for ph, ev in self._parsed_cmds if ph == "pre"}
+        self._active_after = frozenset(self._py_hooks_after) | {ev for ph, ev in self._parsed_cmds if ph == "post"}
 
     def before(self, event: str, context: Dict[str, Any]) -> bool:
         """Execute Python `before_*` hooks, then configured pre commands."""
-        # Capture parameters from incoming context
-        self._capture_params(context)
-        # Apply shared parameters for downstream script usage
-        self._apply_shared_params(context)
+        if self._active_before is not None and event not in self._active_before:
+            # Nothing to run: only record parameters for later events
+            self._record_params(context)
+            return True
+        # Capture parameters from incoming context and apply shared ones
+        # for downstream script usage
+        self._sync_params(context)
         # Make env manager available to python hooks via context
         if self.env_manager and "env_manager" not in context:
             context["env_manager"] = self.env_manager
         # Make project root available for scripts needing output path inference
         if "project_root" not in context:
-            try:
-                context["project_root"] = str(self.project_root)
-            except Exception:
-                pass
+            context["project_root"] = self._root_str
 
         # Validate parameters once per event (non-fatal)
         self._validate_params(context)
 
         # Run Python hooks first to allow abort
-        for fn in self._py_hooks_before.get(event, []):
+        for fn in self._py_hooks_before.get(event, _EMPTY):
             try:
                 rv = fn(context)
                 if rv is False:
@@ -87,7 +152,7 @@ class HookPlugin(Plugin):
                 self._log_context(context, level="error", message=msg)
                 return False
 
-        cmds = self._get_cmds("pre", event)
+        cmds = self._get_parsed_cmds("pre", event)
         if not cmds:
             return True
         ok = self._run_cmds(cmds, abort_on_failure=bool(self.config.get("abort_on_failure", True)))
@@ -99,18 +164,17 @@ class HookPlugin(Plugin):
 
     def after(self, event: str, context: Dict[str, Any]) -> None:
         """Execute Python `after_*` hooks and configured post commands."""
+        if self._active_after is not None and event not in self._active_after:
+            self._record_params(context)
+            return
         # Capture and apply shared params for after hooks as well
-        self._capture_params(context)
-        self._apply_shared_params(context)
+        self._sync_params(context)
         if self.env_manager and "env_manager" not in context:
             context["env_manager"] = self.env_manager
         if "project_root" not in context:
-            try:
-                context["project_root"] = str(self.project_root)
-            except Exception:
-                pass
+            context["project_root"] = self._root_str
 
-        for fn in self._py_hooks_after.get(event, []):
+        for fn in self._py_hooks_after.get(event, _EMPTY):
             try:
                 fn(context)
             except Exception:
@@ -118,38 +182,90 @@ class HookPlugin(Plugin):
                 self._logger.error(msg)
                 self._log_context(context, level="error", message=msg)
 
-        cmds = self._get_cmds("post", event)
+        cmds = self._get_parsed_cmds("post", event)
         if not cmds:
             return
-        self._run_cmds(cmds, abort_on_failure=False)
+        # Post commands are independent, so plain ones may overlap; python
+        # and pip commands share the environment and stay sequential
+        if len(cmds) > 1 and self.config.get("parallel_post") and all(c[0] == _KIND_OTHER for c in cmds):
+            self._run_parallel(cmds)
+        else:
+            self._run_cmds(cmds, abort_on_failure=False)
 
     # ===== Command-based hooks =====
     def _get_cmds(self, phase: str, event: str) -> List[str]:
-        cfg = self.config.get(phase, {}) if isinstance(self.config.get(phase), dict) else {}
-        cmds = cfg.get(event, []) or []
-        return [str(c) for c in cmds]
+        cfg = self.config.get(phase)
+        cmds = (cfg.get(event) if isinstance(cfg, dict) else None) or []
+        return [c if isinstance(c, str) else str(c) for c in cmds]
+
+    def _precompile_cmds(self) -> None:
+        """Split every configured command once and classify how it runs.
+
+        Each command becomes `(kind, argv, args)`: `args` is the full split
+        command and `argv` what the environment manager runs, i.e. the
+        interpreter arguments for `python` and the pip arguments for `pip`.
+        `kind` is one of the `_KIND_*` constants: python, pip, other, or
+        invalid for strings `shlex` rejects.
+        """
+        parsed: Dict[Tuple[str, str], Tuple[Tuple[int, List[str], List[str]], ...]] = {}
+        for phase in ("pre", "post"):
+            cfg = self.config.get(phase)
+            if not isinstance(cfg, dict):
+                continue
+            for event in cfg:
+                entries: List[Tuple[int, List[str], List[str]]] = []
+                for cmd in self._get_cmds(phase, event):
+                    try:
+                        args = shlex.split(cmd)
+                    except ValueError:
+                        entries.append((_KIND_INVALID, [cmd], [cmd]))
+                        continue
+                    if not args:
+                        continue
+                    kind = _KIND_BY_HEAD.get(args[0])
+                    if kind is not None:
+                        entries.append((kind, args[1:], args))
+                        continue
+                    first = args[0].lower()
+                    if first.startswith("python"):
+                        entries.append((_KIND_PYTHON, args[1:], args))
+                    elif Path(args[0]).suffix == ".py":
+                        entries.append((_KIND_PYTHON, args, args))
+                    elif first == "pip":
+                        entries.append((_KIND_PIP, args[1:], args))
+                    else:
+                        entries.append((_KIND_OTHER, args, args))
+                if entries:
+                    parsed[(phase, event)] = tuple(entries)
+        self._parsed_cmds = parsed
 
-    def _run_cmds(self, cmds: List[str], abort_on_failure: bool) -> bool:
+    def _get_parsed_cmds(self, phase: str, event: str) -> Tuple[Tuple[int, List[str], List[str]], ...]:
+        if self._parsed_cmds is None:
+            self._precompile_cmds()
+        return self._parsed_cmds.get((phase, event), ())
+
+    def _run_cmds(self, cmds: Sequence[Tuple[int, List[str], List[str]]], abort_on_failure: bool) -> bool:
         ok = True
         try:
             self._ensure_env()
         except Exception:
             if abort_on_failure:
                 return False
-        for cmd in cmds:
+        # Activated environment, built on first use and shared by the batch
+        env: Any = _MISSING
+        for kind, argv, args in cmds:
             try:
-                args = shlex.split(cmd)
-                if not args:
-                    continue
-                first = args[0].lower()
-                if first.startswith("python") or Path(args[0]).suffix == ".py":
-                    py_args = args[1:] if first.startswith("python") else args
-                    completed = self.env_manager.run_python(py_args, capture_output=False) if self.env_manager else subprocess.run(args, cwd=self.project_root)
-                elif first == "pip":
-                    completed = self.env_manager.run_pip(args[1:], capture_output=False) if self.env_manager else subprocess.run(args, cwd=self.project_root)
+                # Plain commands are the common case and are tested first
+                if kind == _KIND_OTHER:
+                    if env is _MISSING:
+                        env = self.env_manager.activate() if self.env_manager else None
+                    completed = self._spawn(args, env)
+                elif kind == _KIND_PYTHON:
+                    completed = self.env_manager.run_python(argv, capture_output=False) if self.env_manager else subprocess.run(args, cwd=self._root_str)
+                elif kind == _KIND_PIP:
+                    completed = self.env_manager.run_pip(argv, capture_output=False) if self.env_manager else subprocess.run(args, cwd=self._root_str)
                 else:
-                    env = self.env_manager.activate() if self.env_manager else None
-                    completed = subprocess.run(args, cwd=self.project_root, env=env)
+                    raise ValueError(f"Unparsable hook command: {args[0]}")
                 if completed.returncode != 0:
                     ok = False
                     if abort_on_failure:
@@ -160,6 +276,68 @@ class HookPlugin(Plugin):
                     return False
         return ok
 
+    def _spawn(self, args: List[str], env: Optional[Dict[str, str]]) -> subprocess.CompletedProcess:
+        """Run a plain command to completion; see `_spawn_kwargs`."""
+        return subprocess.run(args, **self._spawn_kwargs(args, env))
+
+    def _spawn_kwargs(self, args: List[str], env: Optional[Dict[str, str]]) -> Dict[str, Any]:
+        """Return subprocess arguments keeping to CPython's `posix_spawn` path.
+
+        `subprocess` only uses `posix_spawn` (vfork + exec, no page-table
+        copy of this process) for an absolute executable, no `cwd`, and
+        `close_fds=False`; Python's own descriptors are non-inheritable, so
+        not closing them leaks nothing. The executable is resolved against
+        the command's PATH once and cached; `cwd` is dropped when it is the
+        current directory anyway. Elsewhere these are plain `cwd`/`env`.
+        """
+        if os.name != "posix":
+            return {"cwd": self._root_str, "env": env}
+        name = args[0]
+        exe: Optional[str] = name
+        if os.sep not in name:
+            path = (env if env is not None else os.environ).get("PATH", os.defpath)
+            key = (name, path)
+            if key not in self._exe_cache:
+                self._exe_cache[key] = shutil.which(name, path=path)
+            exe = self._exe_cache[key]
+        elif not os.path.isabs(name):
+            exe = None  # relative to the project root; let `cwd` resolve it
+        root = self._root_str
+        cwd = None if os.path.abspath(root) == os.getcwd() else root
+        if cwd is not None:
+            exe = None
+        return {"executable": exe, "cwd": cwd, "env": env, "close_fds": False}
+
+    def _run_parallel(self, cmds: Sequence[Tuple[int, List[str], List[str]]]) -> bool:
+        """Start every plain command at once, then wait for all of them.
+
+        Parameters
+        - cmds (Sequence[Tuple[int, List[str], List[str]]]): Parsed commands, all of kind `_KIND_OTHER`.
+
+        Returns
+        - bool: True if every command started and exited with status 0.
+        """
+        ok = True
+        try:
+            self._ensure_env()
+        except Exception:
+            pass
+        env = None
+        try:
+            env = self.env_manager.activate() if self.env_manager else None
+        except Exception:
+            pass
+        procs: List[subprocess.Popen] = []
+        for _, _, args in cmds:
+            try:
+                procs.append(subprocess.Popen(args, **self._spawn_kwargs(args, env)))
+            except Exception:
+                ok = False
+        for proc in procs:
+            if proc.wait() != 0:
+                ok = False
+        return ok
+
     def _ensure_env(self) -> None:
         if not self.env_manager:
             from ..environment import EnvironmentManager
@@ -178,98 +356,144 @@ class HookPlugin(Plugin):
             if spec.endswith(".py") or "/" in spec or "\\" in spec:
                 path = (self.project_root / spec).resolve()
                 if not path.exists():
-                    self._logger.error(f"Hook script not found: {path}")
+                    self._logger.error("Hook script not found: %s", path)
                     self._log_context({}, level="error", message=f"Hook script not found: {path}")
                     return None
                 mod_name = f"pkg_hook_{path.stem}"
                 try:
+                    # Re-activation reuses the executed module unless the
+                    # script changed on disk
+                    mtime = path.stat().st_mtime_ns
+                    cached = _SCRIPT_MODULES.get(str(path))
+                    if cached is not None and cached[0] == mtime:
+                        return cached[1]
                     spec_obj = importlib.util.spec_from_file_location(mod_name, str(path))
                     if spec_obj and spec_obj.loader:
                         mod = importlib.util.module_from_spec(spec_obj)
                         spec_obj.loader.exec_module(mod)  # type: ignore
+                        _SCRIPT_MODULES[str(path)] = (mtime, mod)
                         return mod
                 except Exception as e:
-                    self._logger.error(f"Load hook script failed: {e}")
+                    self._logger.error("Load hook script failed: %s", e)
                     self._log_context({}, level="error", message=f"Load hook script failed: {e}")
                     return None
                 return None
             try:
-                return importlib.import_module(spec)
+                return _cached_import(spec)
             except Exception as e:
-                self._logger.error(f"Import hook module failed: {spec} -> {e}")
+                self._logger.error("Import hook module failed: %s -> %s", spec, e)
                 self._log_context({}, level="error", message=f"Import hook module failed: {spec} -> {e}")
                 return None
 
         mod = _import_single(script)
         if not mod:
             return
-        known_events = {"build", "venv", "deps_install", "backend_prepare", "backend_build"}
-        for ev in known_events:
-            bfn = getattr(mod, f"before_{ev}", None)
-            if callable(bfn):
-                self._py_hooks_before.setdefault(ev, []).append(bfn)
-            afn = getattr(mod, f"after_{ev}", None)
-            if callable(afn):
-                self._py_hooks_after.setdefault(ev, []).append(afn)
+        # One pass over the module namespace instead of a getattr per event
+        # into lists, frozen again below
+        before = {ev: list(fns) for ev, fns in self._py_hooks_before.items()}
+        after = {ev: list(fns) for ev, fns in self._py_hooks_after.items()}
+        for attr, fn in vars(mod).items():
+            if attr.startswith(_BEFORE_PREFIX):
+                ev, bucket = attr[len(_BEFORE_PREFIX):], before
+            elif attr.startswith(_AFTER_PREFIX):
+                ev, bucket = attr[len(_AFTER_PREFIX):], after
+            else:
+                continue
+            if ev in _KNOWN_EVENTS and callable(fn):
+                bucket.setdefault(sys.intern(ev), []).append(fn)
+        self._py_hooks_before = {ev: tuple(fns) for ev, fns in before.items()}
+        self._py_hooks_after = {ev: tuple(fns) for ev, fns in after.items()}
 
     # ===== Context logging =====
     def _log_context(self, context: Dict[str, Any], level: str, message: str) -> None:
         try:
-            ctx = context if isinstance(context, dict) else {}
-            logs = ctx.setdefault("plugin_logs", {})
-            logs.setdefault(self.name, [])
-            logs[self.name].append({"level": level, "message": message})
+            if context is not self._log_ctx:
+                self._bind_log_list(context)
+            self._log_list.append({"level": level, "message": message})
         except Exception:
             pass
 
+    def _bind_log_list(self, context: Dict[str, Any]) -> None:
+        """Look up (creating it if needed) this plugin's log list in *context* once.
+
+        Bound on the first message for a context rather than on entry to
+        `before`/`after`, so contexts that never log gain no `plugin_logs` key.
+        """
+        ctx = context if isinstance(context, dict) else {}
+        logs = ctx.get("plugin_logs")
+        if logs is None:
+            logs = ctx["plugin_logs"] = {}
+        lst = logs.get(self.name)
+        if lst is None:
+            lst = logs[self.name] = []
+        self._log_ctx = context
+        self._log_list = lst
+
     # ===== Parameter capture / propagate / validate =====
-    def _capture_params(self, context: Dict[str, Any]) -> None:
-        """Capture output and temp_dir from any incoming context and store them."""
-        try:
-            out = context.get("output")
-            tmp = context.get("temp_dir")
-            # Record output if present and non-empty
-            if out is not None:
-                self._shared_params["output"] = out
-            # Record temp_dir with flexible key recognition
-            if tmp is not None:
-                self._shared_params["temp_dir"] = tmp
-        except Exception as e:
-            self._logger.error(f"capture params failed: {e}")
+    def _sync_params(self, context: Dict[str, Any]) -> None:
+        """Capture output/temp_dir from *context*, then fill in missing ones.
 
-    def _apply_shared_params(self, context: Dict[str, Any]) -> None:
-        """Inject previously captured parameters into current context if missing."""
-        try:
-            if "output" not in context and "output" in self._shared_params:
-                context["output"] = self._shared_params["output"]
-                self._logger.info(f"applied output to context: {context['output']}")
-            if "temp_dir" not in context:
-                # Accept flexible naming, but normalize to temp_dir in context
-                if "temp_dir" in self._shared_params:
-                    context["temp_dir"] = self._shared_params["temp_dir"]
-                    self._logger.info(f"applied temp_dir to context: {context['temp_dir']}")
-        except Exception as e:
-            self._logger.error(f"apply params failed: {e}")
+        A non-None value in the context is recorded for later events; a key
+        the context lacks is injected from previously recorded values. Each
+        key costs one lookup in each dict.
+        """
+        if not isinstance(context, dict):
+            return
+        shared = self._shared_params
+        for key in _SHARED_KEYS:
+            value = context.get(key, _MISSING)
+            if value is _MISSING:
+                value = shared.get(key, _MISSING)
+                if value is not _MISSING:
+                    context[key] = value
+                    # Messages are only built when info logging is on
+                    if self._logger.isEnabledFor(logging.INFO):
+                        try:
+                            self._logger.info("applied %s to context: %s", key, value)
+                        except Exception as e:
+                            self._logger.error("sync params failed: %s", e)
+            elif value is not None:
+                shared[key] = value
+
+    def _record_params(self, context: Dict[str, Any]) -> None:
+        """Record non-None output/temp_dir from *context* without touching it."""
+        if not isinstance(context, dict):
+            return
+        for key in _SHARED_KEYS:
+            value = context.get(key)
+            if value is not None:
+                self._shared_params[key] = value
 
     def _validate_params(self, context: Dict[str, Any]) -> None:
         """Validate output and temp_dir parameters; log warnings on invalid values."""
         try:
             # Validate output
+            last = self._last_validated
             out = context.get("output")
-            if out is not None:
-                out_path = Path(str(out))
+            if out is not None and last.get("output") != out:
+                # Plain os.path string handling; this only feeds one stat
+                out_s = os.fspath(out) if isinstance(out, (str, os.PathLike)) else str(out)
+                out_s = out_s.rstrip("/" + os.sep) or out_s
                 # No assumption about directory name; ensure parent exists or can be created
-                parent = out_path if out_path.suffix == "" else out_path.parent
-                if not parent.exists():
-                    # Non-fatal: log and continue
-                    self._logger.warning(f"output path does not exist yet: {parent}")
+                if len(os.path.splitext(out_s)[1]) > 1:  # has a suffix, as Path.suffix
+                    parent = os.path.dirname(out_s) or "."
+                else:
+                    parent = out_s
+                if parent != self._root_str and parent not in self._existing_dirs:
+                    if os.path.exists(parent):
+                        self._existing_dirs.add(parent)
+                    else:
+                        # Non-fatal: log and continue
+                        self._logger.warning("output path does not exist yet: %s", parent)
+                last["output"] = out
             # Validate temp_dir: create if possible
             tmp = context.get("temp_dir")
-            if tmp is not None:
-                tmp_path = Path(str(tmp))
+            if tmp is not None and last.get("temp_dir") != tmp:
+                tmp_s = os.fspath(tmp) if isinstance(tmp, (str, os.PathLike)) else str(tmp)
                 try:
-                    tmp_path.mkdir(parents=True, exist_ok=True)
+                    os.makedirs(tmp_s, exist_ok=True)
+                    last["temp_dir"] = tmp
                 except Exception as e:
-                    self._logger.warning(f"temp_dir not creatable: {tmp_path} -> {e}")
+                    self._logger.warning("temp_dir not creatable: %s -> %s", tmp_s, e)
         except Exception as e:
-            self._logger.error(f"validate params failed: {e}")
\ No newline at end of file
+            self._logger.error("validate params failed: %s", e)
\ No newline at end of file